@@ -232,6 +232,8 @@ def cmd_web(args):
     host = args.host
     port = args.port
     debug = args.debug
+    threads = args.threads
+    workers = args.workers
 
     console.print(f"[bold cyan]Starting web server...[/bold cyan]")
     console.print(f"[green]✓[/green] Server running at http://{host}:{port}")
@@ -244,7 +246,7 @@ def cmd_web(args):
     console.print("\nPress Ctrl+C to stop\n")
 
     try:
-        run_web_server(host=host, port=port, debug=debug)
+        run_web_server(host=host, port=port, debug=debug, threads=threads, workers=workers)
     except KeyboardInterrupt:
         console.print("\n[yellow]Web server stopped[/yellow]")
 
@@ -327,6 +329,18 @@ def main():
         action="store_true",
         help="Enable debug mode",
     )
+    parser_web.add_argument(
+        "--threads",
+        type=int,
+        default=8,
+        help="Number of requests each worker handles concurrently (default: 8)",
+    )
+    parser_web.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1; use --threads for concurrency)",
+    )
 
     # telegram-bot command
     parser_telegram_bot = subparsers.add_parser(
@@ -94,10 +94,25 @@ class Config:
         self.proxy_max_retries = int(os.getenv("PROXY_MAX_RETRIES", "3"))
         self.proxy_retry_delay = float(os.getenv("PROXY_RETRY_DELAY", "2.0"))
 
+        # Web server configuration
+        # Where login rate-limit counters live; the default keeps them in each
+        # worker's memory. A shared backend (e.g. redis://host:6379) makes
+        # the limit apply across workers.
+        self.ratelimit_storage_uri = os.getenv("RATELIMIT_STORAGE_URI", "memory://")
+        # Number of reverse proxies in front of the web server whose
+        # X-Forwarded-* headers are trusted (0 = use the connecting address)
+        self.trusted_proxies = int(os.getenv("TRUSTED_PROXIES", "0"))
+
         # Telegram Bot Configuration
         self.telegram_bot_token = os.getenv("TELEGRAM_BOT_TOKEN", "")
         self.telegram_enabled = bool(self.telegram_bot_token)
 
+        # Telegram webhook mode (optional, falls back to polling when unset)
+        self.telegram_webhook_url = os.getenv("TELEGRAM_WEBHOOK_URL", "")
+        self.telegram_webhook_secret = os.getenv("TELEGRAM_WEBHOOK_SECRET", "")
+        self.telegram_webhook_listen = os.getenv("TELEGRAM_WEBHOOK_LISTEN", "0.0.0.0")
+        self.telegram_webhook_port = int(os.getenv("TELEGRAM_WEBHOOK_PORT", "8443"))
+
     def validate(self) -> tuple[bool, list[str]]:
         """Validate configuration.
 
@@ -135,7 +150,9 @@ class Config:
             "proxy_count": len(self.proxy_list),
             "proxy_rate_limit": self.proxy_rate_limit,
             "proxy_max_retries": self.proxy_max_retries,
+            "trusted_proxies": self.trusted_proxies,
             "telegram_enabled": self.telegram_enabled,
+            "telegram_webhook_enabled": bool(self.telegram_webhook_url),
         }
 
     @staticmethod
@@ -206,9 +223,23 @@ DAYS_TO_LOOK_BACK=7
         # Retry delay in seconds (default: 2.0)
         # PROXY_RETRY_DELAY=2.0
 
+# Web server (Optional)
+# Login rate-limit storage; defaults to per-worker memory
+# RATELIMIT_STORAGE_URI=redis://localhost:6379
+# Set to the number of reverse proxies in front of ytsum (e.g. 1 for nginx)
+# so rate limits apply to the real client address from X-Forwarded-For
+# TRUSTED_PROXIES=0
+
 # Telegram Bot Configuration (Optional)
 # Get bot token from @BotFather on Telegram
 # TELEGRAM_BOT_TOKEN=your_bot_token_here
+#
+# Webhook mode (optional - polling is used when TELEGRAM_WEBHOOK_URL is unset)
+# Public HTTPS URL Telegram pushes updates to; its path is served by the bot
+# TELEGRAM_WEBHOOK_URL=https://bot.example.com/telegram
+# TELEGRAM_WEBHOOK_SECRET=random_secret_token
+# TELEGRAM_WEBHOOK_LISTEN=0.0.0.0
+# TELEGRAM_WEBHOOK_PORT=8443
 """
 
         output_path.write_text(content)
@@ -1,31 +1,55 @@
 """Database models and operations for ytsum."""
 
 import json
-from datetime import datetime
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from itertools import groupby
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
+    JSON,
     String,
     Text,
     Table,
     create_engine,
     UniqueConstraint,
+    case,
+    column,
+    event,
+    func,
+    exists,
+    insert,
     inspect,
+    literal,
+    or_,
+    select,
     text,
 )
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, relationship, sessionmaker, joinedload
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy.orm import Session, contains_eager, relationship, selectinload, sessionmaker
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from werkzeug.security import check_password_hash
 from flask_login import UserMixin
 
+logger = logging.getLogger(__name__)
+
 Base = declarative_base()
 
+# argon2id tuned for interactive logins (~64 MB, two passes)
+password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+
 # Junction table for many-to-many relationship between users and channels
 user_channels = Table(
     'user_channels',
@@ -61,10 +85,25 @@ class User(UserMixin, Base):
     )
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        if not self.password_hash:
+            return False
+        if not self.password_hash.startswith("$argon2"):
+            # Hashed by Werkzeug before the switch to argon2
+            return check_password_hash(self.password_hash, password)
+        try:
+            return password_hasher.verify(self.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def password_needs_rehash(self) -> bool:
+        """Whether the stored hash predates the current hashing settings."""
+        return (
+            not self.password_hash.startswith("$argon2")
+            or password_hasher.check_needs_rehash(self.password_hash)
+        )
 
     def __repr__(self):
         return f"<User {self.username}>"
@@ -116,6 +155,18 @@ class Video(Base):
     transcript = relationship("Transcript", back_populates="video", uselist=False)
     summary = relationship("Summary", back_populates="video", uselist=False)
 
+    # Video listings are always newest first, either across channels or
+    # within one channel; these let SQLite walk the index instead of sorting
+    __table_args__ = (
+        Index("ix_videos_published", published_at.desc(), id.desc()),
+        Index(
+            "ix_videos_channel_published",
+            youtube_channel_id,
+            published_at.desc(),
+            id.desc(),
+        ),
+    )
+
     def __repr__(self):
         return f"<Video(title='{self.title}', id='{self.video_id}')>"
 
@@ -145,21 +196,28 @@ class Summary(Base):
     id = Column(Integer, primary_key=True)
     video_id = Column(Integer, ForeignKey("videos.id"), nullable=False, unique=True)
     summary_text = Column(Text, nullable=False)
-    key_points = Column(Text, nullable=True)  # JSON array of key points
+    key_points = Column(JSON(none_as_null=True), nullable=True)  # List of key points, stored as a JSON array
     model_used = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     video = relationship("Video", back_populates="summary")
 
     def get_key_points(self) -> List[str]:
-        """Parse and return key points as a list."""
-        if self.key_points:
-            return json.loads(self.key_points)
-        return []
+        """Return key points as a list."""
+        return self.parse_key_points(self.key_points)
+
+    @staticmethod
+    def parse_key_points(key_points: Optional[List[str]]) -> List[str]:
+        """Return a key_points value (e.g. from a column query) as a list.
+
+        The JSON column is decoded as rows are loaded, so this only maps a
+        missing value to an empty list.
+        """
+        return key_points or []
 
     def set_key_points(self, points: List[str]):
         """Set key points from a list."""
-        self.key_points = json.dumps(points)
+        self.key_points = list(points)
 
     def __repr__(self):
         return f"<Summary(video_id={self.video_id}, model='{self.model_used}')>"
@@ -192,6 +250,26 @@ class RunHistory(Base):
         return f"<RunHistory(timestamp={self.run_timestamp}, processed={self.videos_processed})>"
 
 
+class RunJob(Base):
+    """A manual run started from the web interface.
+
+    Kept in the database so every web worker can report on it, and so only
+    one run is active at a time across workers.
+    """
+
+    __tablename__ = "run_jobs"
+
+    id = Column(String(32), primary_key=True)  # UUID hex
+    status = Column(String(20), nullable=False, default="running")  # running, done, failed
+    result = Column(JSON(none_as_null=True), nullable=True)
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime, default=datetime.utcnow, index=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<RunJob(id={self.id}, status={self.status})>"
+
+
 class TelegramQueue(Base):
     """Queue for Telegram messages to be sent.
     
@@ -221,6 +299,68 @@ class TelegramQueue(Base):
 # Add relationship to User model
 User.telegram_queue_items = relationship("TelegramQueue", back_populates="user")
 
+# A running job older than this is assumed to have died with its worker
+RUN_JOB_TIMEOUT = timedelta(hours=2)
+# Finished jobs are kept this long for status polls, then deleted
+RUN_JOB_RETENTION = timedelta(days=1)
+
+# How long get_stats results are reused before the counts are re-queried.
+# Writes through the same Database instance invalidate the cache immediately,
+# but writes by other processes (scheduler, Telegram bot, other web workers)
+# can't, so this is kept short: it's the most those counts can lag.
+STATS_CACHE_TTL = 5.0
+
+# Full-text index over video titles and channel names, kept in sync by
+# triggers. The trigram tokenizer matches substrings like LIKE '%term%' does.
+SEARCH_INDEX_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS videos_fts USING fts5(
+        title, channel_name, tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS videos_fts_insert AFTER INSERT ON videos BEGIN
+        INSERT INTO videos_fts (rowid, title, channel_name)
+        SELECT new.id, new.title, channel_name FROM youtube_channels
+        WHERE id = new.youtube_channel_id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS videos_fts_update AFTER UPDATE OF title, youtube_channel_id ON videos BEGIN
+        UPDATE videos_fts SET
+            title = new.title,
+            channel_name = (SELECT channel_name FROM youtube_channels WHERE id = new.youtube_channel_id)
+        WHERE rowid = new.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS videos_fts_delete AFTER DELETE ON videos BEGIN
+        DELETE FROM videos_fts WHERE rowid = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS youtube_channels_fts_update AFTER UPDATE OF channel_name ON youtube_channels BEGIN
+        UPDATE videos_fts SET channel_name = new.channel_name
+        WHERE rowid IN (SELECT id FROM videos WHERE youtube_channel_id = new.id);
+    END""",
+]
+
+SEARCH_INDEX_EXISTS = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'videos_fts'"
+
+# Fills a newly created search index with the existing videos
+SEARCH_INDEX_BACKFILL = """INSERT INTO videos_fts (rowid, title, channel_name)
+    SELECT v.id, v.title, c.channel_name
+    FROM videos v JOIN youtube_channels c ON c.id = v.youtube_channel_id"""
+
+# Trigram search needs at least this many characters; shorter terms use LIKE
+SEARCH_INDEX_MIN_LENGTH = 3
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection.
+
+    WAL lets readers (web requests, the TUI) proceed while the scheduler
+    writes, and with synchronous=NORMAL commits skip the per-transaction
+    fsync. A memory-mapped file and a larger page cache speed up reads.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+    cursor.close()
+
 
 class Database:
     """Database manager for ytsum."""
@@ -237,11 +377,24 @@ class Database:
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self.db_path = db_path
-        self.engine = create_engine(f"sqlite:///{db_path}")
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        # Pooled connections are reused across requests and threads
+        self.engine = create_engine(f"sqlite:///{db_path}", pool_size=10, max_overflow=20)
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
+        # Objects stay usable after commit; most methods hand them back to
+        # callers once the session is closed
+        self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
+        self._stats_cache: Dict[Optional[int], Tuple[float, dict]] = {}
+        # One lock per user serializes that user's cache misses, so
+        # concurrent requests share one recount without waiting on other
+        # users' recounts; the guard only protects creating the locks
+        self._stats_locks: Dict[Optional[int], threading.Lock] = {}
+        self._stats_locks_guard = threading.Lock()
+        # Bumped by invalidate_stats so a recount racing a write isn't cached
+        self._stats_generation = 0
 
         # Check if we need to migrate from old schema
         self._migrate_if_needed()
+        self.search_index_enabled = self._create_search_index()
 
     def _migrate_if_needed(self):
         """Check and perform database migrations if needed."""
@@ -295,6 +448,80 @@ class Database:
         # Create all tables with new schema
         Base.metadata.create_all(self.engine)
 
+        # create_all skips tables that already exist, so add any indexes
+        # introduced since an existing database was created. IF NOT EXISTS
+        # makes this safe when several processes start at once.
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+
+    def _create_search_index(self) -> bool:
+        """Create and fill the full-text search index if it doesn't exist yet.
+
+        Returns:
+            True if the index is available, False if this SQLite build lacks
+            FTS5 trigram support.
+        """
+        if self._search_index_exists():
+            return True
+
+        try:
+            with self.engine.connect() as conn:
+                # Take the write lock before looking again, so when several
+                # processes start at once exactly one creates and fills it
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+                created = not conn.execute(
+                    text(SEARCH_INDEX_EXISTS)
+                ).first()
+                if created:
+                    for statement in SEARCH_INDEX_DDL:
+                        conn.execute(text(statement))
+                    conn.execute(text(SEARCH_INDEX_BACKFILL))
+                conn.commit()
+        except OperationalError as e:
+            # Another process may have created it after all
+            if self._search_index_exists():
+                return True
+            logger.warning(f"Full-text search unavailable, falling back to LIKE: {e}")
+            return False
+
+        return True
+
+    def _search_index_exists(self) -> bool:
+        """Whether the full-text search table is in the database."""
+        with self.engine.connect() as conn:
+            return conn.execute(
+                text(SEARCH_INDEX_EXISTS)
+            ).first() is not None
+
+    def video_search_filter(self, search: str):
+        """Build a filter for videos whose title or channel name contains search.
+
+        The query being filtered must already join YouTubeChannel.
+
+        Args:
+            search: Text to look for (case-insensitive).
+
+        Returns:
+            SQLAlchemy filter expression for Video queries.
+        """
+        if self.search_index_enabled and len(search) >= SEARCH_INDEX_MIN_LENGTH:
+            # Quote as an FTS5 string so the input is matched literally
+            phrase = '"' + search.replace('"', '""') + '"'
+            matches = (
+                text("SELECT rowid FROM videos_fts WHERE videos_fts MATCH :search_phrase")
+                .bindparams(search_phrase=phrase)
+                .columns(column("rowid", Integer))
+            )
+            return Video.id.in_(matches)
+
+        search_pattern = f"%{search}%"
+        return or_(
+            Video.title.ilike(search_pattern),
+            YouTubeChannel.channel_name.ilike(search_pattern),
+        )
+
     def _perform_migration_v2(self):
         """Migrate from old schema to new normalized schema.
         
@@ -369,6 +596,11 @@ class Database:
         """Get a new database session."""
         return self.SessionLocal()
 
+    def invalidate_stats(self):
+        """Drop cached get_stats results after a write that changes the counts."""
+        self._stats_generation += 1
+        self._stats_cache.clear()
+
     # User operations
     def add_user(self, username, password):
         """Add a new user."""
@@ -393,6 +625,27 @@ class Database:
                 session.expunge(user)
             return user
 
+    def authenticate_user(self, username: str, password: str) -> Optional[User]:
+        """Check a username and password.
+
+        A hash made with older settings (or by Werkzeug) is replaced with a
+        current argon2id hash once the password is known to be right.
+
+        Returns:
+            The user if the credentials are valid, None otherwise.
+        """
+        with self.get_session() as session:
+            user = session.query(User).filter_by(username=username).first()
+            if not user or not user.check_password(password):
+                return None
+
+            if user.password_needs_rehash():
+                user.set_password(password)
+                session.commit()
+
+            session.expunge(user)
+            return user
+
     def get_user_by_username(self, username):
         """Get user by username."""
         with self.get_session() as session:
@@ -427,6 +680,7 @@ class Database:
                 session.add(youtube_channel)
                 session.commit()
                 session.refresh(youtube_channel)
+                self.invalidate_stats()
             
             if user_id is not None:
                 # Check if user already follows this channel
@@ -437,6 +691,7 @@ class Database:
                 # Associate user with channel
                 user.youtube_channels.append(youtube_channel)
                 session.commit()
+                self.invalidate_stats()
             
             session.expunge(youtube_channel)
             return youtube_channel
@@ -466,6 +721,78 @@ class Database:
                 session.expunge_all()
                 return channels
 
+    def get_channel_choices(self, user_id: int) -> List[tuple]:
+        """Get the channels offered in a user's channel filter dropdowns.
+
+        Args:
+            user_id: User whose channels to return.
+
+        Returns:
+            List of (id, channel_name) rows, in follow order.
+        """
+        with self.get_session() as session:
+            return (
+                session.query(YouTubeChannel.id, YouTubeChannel.channel_name)
+                .join(user_channels, user_channels.c.youtube_channel_id == YouTubeChannel.id)
+                .filter(user_channels.c.user_id == user_id)
+                .order_by(user_channels.c.added_date, YouTubeChannel.id)
+                .all()
+            )
+
+    def get_channels_with_video_counts(self, user_id: int) -> List[tuple]:
+        """Get a user's followed channels with how many videos each has.
+
+        Counts come from one grouped subquery joined in the same SELECT, so
+        the page needs no per-channel queries.
+
+        Args:
+            user_id: User whose channels to return.
+
+        Returns:
+            List of (YouTubeChannel, video_count) tuples, in follow order.
+        """
+        with self.get_session() as session:
+            video_counts = (
+                session.query(
+                    Video.youtube_channel_id,
+                    func.count(Video.id).label("video_count"),
+                )
+                .group_by(Video.youtube_channel_id)
+                .subquery()
+            )
+            rows = (
+                session.query(
+                    YouTubeChannel,
+                    func.coalesce(video_counts.c.video_count, 0),
+                )
+                .join(user_channels, user_channels.c.youtube_channel_id == YouTubeChannel.id)
+                .outerjoin(video_counts, video_counts.c.youtube_channel_id == YouTubeChannel.id)
+                .filter(user_channels.c.user_id == user_id)
+                .order_by(user_channels.c.added_date, YouTubeChannel.id)
+                .all()
+            )
+            session.expunge_all()
+            return [(channel, count) for channel, count in rows]
+
+    def get_channels_view(self) -> List[tuple]:
+        """Get the columns shown in the channels table, without loading entities.
+
+        Returns:
+            List of (channel_name, channel_id, added, last_checked) rows, with
+            dates already formatted by SQLite (last_checked is None if never checked).
+        """
+        with self.get_session() as session:
+            return (
+                session.query(
+                    YouTubeChannel.channel_name,
+                    YouTubeChannel.channel_id,
+                    func.strftime("%Y-%m-%d", YouTubeChannel.added_date),
+                    func.strftime("%Y-%m-%d %H:%M", YouTubeChannel.last_checked),
+                )
+                .order_by(YouTubeChannel.id)
+                .all()
+            )
+
     def remove_channel(self, channel_id: str, user_id: Optional[int] = None) -> bool:
         """Remove a channel from a user's follows.
 
@@ -485,11 +812,13 @@ class Database:
                 if user and youtube_channel in user.youtube_channels:
                     user.youtube_channels.remove(youtube_channel)
                     session.commit()
+                    self.invalidate_stats()
                     return True
             else:
                 # Remove channel entirely (and all videos via cascade)
                 session.delete(youtube_channel)
                 session.commit()
+                self.invalidate_stats()
                 return True
             
             return False
@@ -546,6 +875,7 @@ class Database:
             session.add(video)
             session.commit()
             session.refresh(video)
+            self.invalidate_stats()
             return video
 
     def get_videos_without_transcripts(self, max_failed_attempts: int = 10) -> List[Video]:
@@ -591,7 +921,9 @@ class Database:
         with self.get_session() as session:
             videos = (
                 session.query(Video)
-                .options(joinedload(Video.transcript), joinedload(Video.youtube_channel))
+                # Separate IN queries, so each channel row is loaded once
+                # rather than repeated next to every one of its videos
+                .options(selectinload(Video.transcript), selectinload(Video.youtube_channel))
                 .filter(Video.transcript.has())
                 .filter(~Video.summary.has())
                 .all()
@@ -604,7 +936,7 @@ class Database:
         with self.get_session() as session:
             videos = (
                 session.query(Video)
-                .options(joinedload(Video.youtube_channel), joinedload(Video.summary))
+                .options(selectinload(Video.youtube_channel), selectinload(Video.summary))
                 .order_by(Video.published_at.desc())
                 .limit(limit)
                 .all()
@@ -613,6 +945,73 @@ class Database:
             session.expunge_all()
             return videos
     
+    def get_recent_videos_view(self, limit: int = 50, offset: int = 0) -> List[tuple]:
+        """Get the columns shown in the videos table, without loading entities.
+
+        The summary text and key points are included so the caller can show a
+        summary without another query.
+
+        Args:
+            limit: Maximum number of rows (page size).
+            offset: Number of newer videos to skip.
+
+        Returns:
+            List of rows with id, title, title_display (cut to 60 characters),
+            channel_name, published (YYYY-MM-DD), has_summary, url, summary_text
+            and key_points (list), newest first.
+        """
+        with self.get_session() as session:
+            return (
+                session.query(
+                    Video.id,
+                    Video.title,
+                    case(
+                        (func.length(Video.title) > 60, func.substr(Video.title, 1, 60) + "..."),
+                        else_=Video.title,
+                    ).label("title_display"),
+                    YouTubeChannel.channel_name,
+                    func.strftime("%Y-%m-%d", Video.published_at).label("published"),
+                    Summary.id.isnot(None).label("has_summary"),
+                    Video.url,
+                    Summary.summary_text,
+                    Summary.key_points,
+                )
+                .join(Video.youtube_channel)
+                .outerjoin(Video.summary)
+                .order_by(Video.published_at.desc(), Video.id.desc())
+                .offset(offset)
+                .limit(limit)
+                .all()
+            )
+
+    def get_video_summary_view(self, video_id: int) -> Optional[tuple]:
+        """Get the columns needed to show one video's summary.
+
+        Args:
+            video_id: Database video ID.
+
+        Returns:
+            Row with title, channel_name, published (YYYY-MM-DD), url,
+            has_summary, summary_text and key_points (list), or None if
+            the video doesn't exist.
+        """
+        with self.get_session() as session:
+            return (
+                session.query(
+                    Video.title,
+                    YouTubeChannel.channel_name,
+                    func.strftime("%Y-%m-%d", Video.published_at).label("published"),
+                    Video.url,
+                    Summary.id.isnot(None).label("has_summary"),
+                    Summary.summary_text,
+                    Summary.key_points,
+                )
+                .join(Video.youtube_channel)
+                .outerjoin(Video.summary)
+                .filter(Video.id == video_id)
+                .first()
+            )
+
     def get_videos_for_user(self, user_id: int, limit: int = 20) -> List[Video]:
         """Get recent videos for channels followed by a specific user."""
         with self.get_session() as session:
@@ -621,7 +1020,8 @@ class Database:
                 .join(Video.youtube_channel)
                 .join(YouTubeChannel.users)
                 .filter(User.id == user_id)
-                .options(joinedload(Video.youtube_channel), joinedload(Video.summary))
+                # The channel is already joined for the filter; reuse that join
+                .options(contains_eager(Video.youtube_channel), selectinload(Video.summary))
                 .order_by(Video.published_at.desc())
                 .limit(limit)
                 .all()
@@ -641,6 +1041,7 @@ class Database:
             session.add(transcript)
             session.commit()
             session.refresh(transcript)
+            self.invalidate_stats()
             return transcript
 
     # Summary operations
@@ -656,8 +1057,25 @@ class Database:
             session.add(summary)
             session.commit()
             session.refresh(summary)
+            self.invalidate_stats()
             return summary
 
+    def _recent_summaries_query(self, session: Session, user_id: Optional[int] = None):
+        """Build the newest-first (Video, Summary) query."""
+        query = (
+            session.query(Video, Summary)
+            .join(Summary)
+            .join(Video.youtube_channel)
+            .options(contains_eager(Video.youtube_channel))
+            .order_by(Summary.created_at.desc())
+        )
+        if user_id is not None:
+            query = (
+                query.join(YouTubeChannel.users)
+                .filter(User.id == user_id)
+            )
+        return query
+
     def get_summaries_with_videos(self, limit: int = 20, user_id: Optional[int] = None) -> List[tuple]:
         """Get recent summaries with their video information.
 
@@ -665,48 +1083,118 @@ class Database:
             List of (Video, Summary) tuples.
         """
         with self.get_session() as session:
-            query = (
-                session.query(Video, Summary)
-                .join(Summary)
-                .join(Video.youtube_channel)
-                .options(joinedload(Video.youtube_channel))
-                .order_by(Summary.created_at.desc())
-            )
-            if user_id is not None:
-                query = (
-                    query.join(YouTubeChannel.users)
-                    .filter(User.id == user_id)
-                )
-
-            results = query.limit(limit).all()
+            results = self._recent_summaries_query(session, user_id).limit(limit).all()
             session.expunge_all()
             return results
 
-    def get_all_summaries_with_channels(self, user_id: Optional[int] = None) -> List[tuple]:
-        """Get all summaries with their video and channel information.
+    def get_dashboard(self, user_id: Optional[int] = None, limit: int = 10) -> dict:
+        """Get the dashboard's stats and recent summaries from one session.
 
-        Used for grouping key points by creator/channel.
+        Args:
+            user_id: Only include channels followed by this user.
+            limit: Number of recent summaries.
 
         Returns:
-            List of (Video, Summary) tuples with eager-loaded channel data.
+            Dictionary with "stats" (as from get_stats) and "recent_summaries"
+            (list of (Video, Summary) tuples).
         """
         with self.get_session() as session:
+            stats = self.get_stats(user_id, session=session)
+            recent_summaries = self._recent_summaries_query(session, user_id).limit(limit).all()
+            session.expunge_all()
+
+        return {"stats": stats, "recent_summaries": recent_summaries}
+
+    def _key_points_query(self, session: Session, user_id: Optional[int], channel_id: Optional[int]):
+        """Build the summarized-videos query shared by the key points methods."""
+        query = (
+            session.query(
+                YouTubeChannel.id.label("channel_id"),
+                YouTubeChannel.channel_name,
+                Video.id.label("video_id"),
+                Video.title,
+                Video.url,
+                Video.published_at,
+                Summary.id.label("summary_id"),
+                Summary.key_points,
+            )
+            .select_from(Summary)
+            .join(Summary.video)
+            .join(Video.youtube_channel)
+        )
+        if user_id is not None:
             query = (
-                session.query(Video, Summary)
-                .join(Summary)
-                .join(Video.youtube_channel)
-                .options(joinedload(Video.youtube_channel))
-                .order_by(Video.youtube_channel_id, Video.published_at.desc())
+                query.join(YouTubeChannel.users)
+                .filter(User.id == user_id)
             )
-            if user_id is not None:
-                query = (
-                    query.join(YouTubeChannel.users)
-                    .filter(User.id == user_id)
+        if channel_id is not None:
+            query = query.filter(YouTubeChannel.id == channel_id)
+        return query
+
+    def get_summary_counts_by_channel(
+        self, user_id: Optional[int] = None, channel_id: Optional[int] = None
+    ) -> Dict[int, int]:
+        """Count summarized videos per channel.
+
+        Args:
+            user_id: Only include channels followed by this user.
+            channel_id: Only include this channel (database ID).
+
+        Returns:
+            Dictionary of channel database ID to number of summarized videos.
+        """
+        with self.get_session() as session:
+            query = (
+                self._key_points_query(session, user_id, channel_id)
+                .with_entities(YouTubeChannel.id, func.count(Summary.id))
+                .group_by(YouTubeChannel.id)
+            )
+            return dict(query.all())
+
+    def iter_key_points_by_channel(
+        self, user_id: Optional[int] = None, channel_id: Optional[int] = None
+    ):
+        """Stream summarized videos' key points grouped by channel.
+
+        Grouping, ordering and the channel filter all happen in SQL, and rows
+        are fetched in batches as the caller iterates, so a long listing is
+        never held in memory at once. Consume each channel's videos before
+        moving to the next channel.
+
+        Args:
+            user_id: Only include channels followed by this user.
+            channel_id: Only include this channel (database ID).
+
+        Yields:
+            (channel_name, {"channel_id", "videos"}) tuples sorted by channel
+            name, where videos is an iterator of dicts, newest first.
+        """
+        with self.get_session() as session:
+            rows = (
+                self._key_points_query(session, user_id, channel_id)
+                .order_by(
+                    YouTubeChannel.channel_name,
+                    YouTubeChannel.id,
+                    Video.published_at.desc(),
                 )
+                .yield_per(200)
+            )
 
-            results = query.all()
-            session.expunge_all()
-            return results
+            for (group_channel_id, channel_name), channel_rows in groupby(
+                rows, key=lambda row: (row.channel_id, row.channel_name)
+            ):
+                videos = (
+                    {
+                        "video_id": row.video_id,
+                        "title": row.title,
+                        "url": row.url,
+                        "published_at": row.published_at,
+                        "key_points": Summary.parse_key_points(row.key_points),
+                        "summary_id": row.summary_id,
+                    }
+                    for row in channel_rows
+                )
+                yield (channel_name, {"channel_id": group_channel_id, "videos": videos})
 
     # Run history operations
     def add_run_history(
@@ -730,8 +1218,74 @@ class Database:
             session.add(run)
             session.commit()
             session.refresh(run)
+            self.invalidate_stats()
             return run
 
+    def start_run_job(self, job_id: str) -> bool:
+        """Record a new manual run, unless another one is still running.
+
+        The check and the insert are one statement, so two workers can't
+        both start a run.
+
+        Args:
+            job_id: ID for the new job.
+
+        Returns:
+            True if the job was recorded, False if a run is already active.
+        """
+        now = datetime.utcnow()
+        with self.get_session() as session:
+            # Drop old finished jobs, and jobs abandoned by a dead worker
+            session.query(RunJob).filter(
+                or_(
+                    RunJob.finished_at < now - RUN_JOB_RETENTION,
+                    RunJob.started_at < now - RUN_JOB_TIMEOUT - RUN_JOB_RETENTION,
+                )
+            ).delete(synchronize_session=False)
+
+            active = exists().where(
+                RunJob.status == "running",
+                RunJob.started_at > now - RUN_JOB_TIMEOUT,
+            )
+            result = session.execute(
+                insert(RunJob).from_select(
+                    ["id", "status", "started_at"],
+                    select(literal(job_id), literal("running"), literal(now)).where(~active),
+                )
+            )
+            session.commit()
+            return result.rowcount == 1
+
+    def finish_run_job(self, job_id: str, result: Optional[dict] = None, error: Optional[str] = None):
+        """Mark a manual run as finished.
+
+        Args:
+            job_id: ID of the job.
+            result: The run's result, if it completed.
+            error: Error message, if it failed.
+        """
+        with self.get_session() as session:
+            job = session.get(RunJob, job_id)
+            if job:
+                job.status = "failed" if error else "done"
+                job.result = result
+                job.error = error
+                job.finished_at = datetime.utcnow()
+                session.commit()
+
+    def get_run_job(self, job_id: str) -> Optional[dict]:
+        """Get a manual run's status.
+
+        Returns:
+            Dictionary with status ("running", "done" or "failed"), result
+            and error, or None if the job doesn't exist.
+        """
+        with self.get_session() as session:
+            job = session.get(RunJob, job_id)
+            if not job:
+                return None
+            return {"status": job.status, "result": job.result, "error": job.error}
+
     def get_run_history(self, limit: int = 50) -> List[RunHistory]:
         """Get recent run history."""
         with self.get_session() as session:
@@ -741,6 +1295,29 @@ class Database:
             session.expunge_all()
             return history
 
+    def get_history_view(self, limit: int = 30) -> List[tuple]:
+        """Get the columns shown in the run history table, without loading entities.
+
+        Returns:
+            List of (id, run_time, videos_found, videos_processed,
+            duration_seconds, success) rows, newest first, with run_time
+            already formatted by SQLite.
+        """
+        with self.get_session() as session:
+            return (
+                session.query(
+                    RunHistory.id,
+                    func.strftime("%Y-%m-%d %H:%M:%S", RunHistory.run_timestamp),
+                    RunHistory.videos_found,
+                    RunHistory.videos_processed,
+                    RunHistory.duration_seconds,
+                    RunHistory.success,
+                )
+                .order_by(RunHistory.run_timestamp.desc())
+                .limit(limit)
+                .all()
+            )
+
     # Telegram operations
     def set_telegram_verification_code(self, user_id: int, code: str) -> bool:
         """Set a verification code for Telegram linking."""
@@ -901,56 +1478,104 @@ class Database:
                 return True
             return False
 
-    def get_stats(self, user_id: Optional[int] = None) -> dict:
-        """Get database statistics."""
-        with self.get_session() as session:
-            if user_id is not None:
-                # Get channels followed by user
-                channel_count = (
-                    session.query(YouTubeChannel)
-                    .join(YouTubeChannel.users)
-                    .filter(User.id == user_id)
-                    .count()
-                )
-                
-                # Get videos from channels followed by user
-                video_query = (
-                    session.query(Video)
-                    .join(Video.youtube_channel)
-                    .join(YouTubeChannel.users)
-                    .filter(User.id == user_id)
-                )
-                
-                transcript_query = (
-                    session.query(Transcript)
-                    .join(Video)
-                    .join(YouTubeChannel)
-                    .join(YouTubeChannel.users)
-                    .filter(User.id == user_id)
-                )
-                
-                summary_query = (
-                    session.query(Summary)
-                    .join(Video)
-                    .join(YouTubeChannel)
-                    .join(YouTubeChannel.users)
-                    .filter(User.id == user_id)
-                )
+    def get_stats(self, user_id: Optional[int] = None, session: Optional[Session] = None) -> dict:
+        """Get database statistics.
+
+        Results are cached per user for STATS_CACHE_TTL seconds and invalidated
+        by writes made through this instance.
+
+        Args:
+            user_id: Count only channels followed by this user.
+            session: Session to run the queries in on a cache miss. A new one
+                is opened if not given.
+        """
+        cached = self._stats_cache.get(user_id)
+        if cached and time.monotonic() < cached[0]:
+            return dict(cached[1])
+
+        with self._stats_lock_for(user_id):
+            # Another thread may have refreshed the entry while we waited
+            cached = self._stats_cache.get(user_id)
+            if cached and time.monotonic() < cached[0]:
+                return dict(cached[1])
+
+            generation = self._stats_generation
+            if session is None:
+                with self.get_session() as own_session:
+                    stats = self._query_stats(own_session, user_id)
             else:
-                channel_count = session.query(YouTubeChannel).count()
-                video_query = session.query(Video)
-                transcript_query = session.query(Transcript).join(Video)
-                summary_query = session.query(Summary).join(Video)
-
-            last_run = session.query(RunHistory).order_by(RunHistory.run_timestamp.desc()).first()
-            if last_run:
-                session.expunge(last_run)
-
-            return {
-                "total_channels": channel_count,
-                "total_videos": video_query.count(),
-                "videos_with_transcripts": transcript_query.count(),
-                "videos_with_summaries": summary_query.count(),
-                "total_runs": session.query(RunHistory).count(),
-                "last_run": last_run,
-            }
+                stats = self._query_stats(session, user_id)
+            if generation == self._stats_generation:
+                self._stats_cache[user_id] = (time.monotonic() + STATS_CACHE_TTL, stats)
+        return dict(stats)
+
+    def _stats_lock_for(self, user_id: Optional[int]) -> threading.Lock:
+        """Get the lock serializing get_stats recounts for one user."""
+        with self._stats_locks_guard:
+            lock = self._stats_locks.get(user_id)
+            if lock is None:
+                lock = self._stats_locks[user_id] = threading.Lock()
+            return lock
+
+    def _query_stats(self, session: Session, user_id: Optional[int] = None) -> dict:
+        """Run the count queries behind get_stats.
+
+        The counts are sent as scalar subqueries of a single SELECT.
+        """
+        if user_id is not None:
+            # Get channels followed by user
+            channel_query = (
+                session.query(func.count(YouTubeChannel.id))
+                .join(YouTubeChannel.users)
+                .filter(User.id == user_id)
+            )
+
+            # Get videos from channels followed by user
+            video_query = (
+                session.query(func.count(Video.id))
+                .join(Video.youtube_channel)
+                .join(YouTubeChannel.users)
+                .filter(User.id == user_id)
+            )
+
+            transcript_query = (
+                session.query(func.count(Transcript.id))
+                .join(Transcript.video)
+                .join(Video.youtube_channel)
+                .join(YouTubeChannel.users)
+                .filter(User.id == user_id)
+            )
+
+            summary_query = (
+                session.query(func.count(Summary.id))
+                .join(Summary.video)
+                .join(Video.youtube_channel)
+                .join(YouTubeChannel.users)
+                .filter(User.id == user_id)
+            )
+        else:
+            channel_query = session.query(func.count(YouTubeChannel.id))
+            video_query = session.query(func.count(Video.id))
+            transcript_query = session.query(func.count(Transcript.id)).join(Transcript.video)
+            summary_query = session.query(func.count(Summary.id)).join(Summary.video)
+
+        counts = session.query(
+            channel_query.scalar_subquery().label("total_channels"),
+            video_query.scalar_subquery().label("total_videos"),
+            transcript_query.scalar_subquery().label("videos_with_transcripts"),
+            summary_query.scalar_subquery().label("videos_with_summaries"),
+            session.query(func.count(RunHistory.id)).scalar_subquery().label("total_runs"),
+        ).one()
+
+        last_run = session.query(RunHistory).order_by(RunHistory.run_timestamp.desc()).first()
+        if last_run:
+            session.expunge(last_run)
+
+        return {
+            "total_channels": counts.total_channels,
+            "total_videos": counts.total_videos,
+            "videos_with_transcripts": counts.videos_with_transcripts,
+            "videos_with_summaries": counts.videos_with_summaries,
+            "total_runs": counts.total_runs,
+            "last_run": last_run,
+        }
@@ -0,0 +1,58 @@
+"""Typed schemas for form posts to the web interface."""
+
+from typing import Annotated, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ConfigDict, StringConstraints, ValidationError
+
+# New usernames and channel inputs ignore surrounding whitespace; passwords
+# are taken exactly as typed
+RequiredText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+RequiredPassword = Annotated[str, StringConstraints(min_length=1)]
+
+FormT = TypeVar("FormT", bound="Form")
+
+
+class Form(BaseModel):
+    """Base class for form schemas."""
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class LoginForm(Form):
+    """Login form. Missing fields are treated as empty.
+
+    The username is matched exactly as typed, so accounts created before
+    registration started stripping whitespace can still log in.
+    """
+
+    username: str = ""
+    password: str = ""
+
+
+class RegisterForm(Form):
+    """Registration form."""
+
+    username: RequiredText
+    password: RequiredPassword
+
+
+class AddChannelForm(Form):
+    """Add channel form."""
+
+    channel_input: RequiredText
+
+
+def parse_form(schema: Type[FormT], form_data) -> Optional[FormT]:
+    """Validate submitted form data against a schema.
+
+    Args:
+        schema: Form class to validate with.
+        form_data: Submitted form (e.g. request.form).
+
+    Returns:
+        The validated form, or None if required fields are missing or invalid.
+    """
+    try:
+        return schema.model_validate(form_data.to_dict())
+    except ValidationError:
+        return None
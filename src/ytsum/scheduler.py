@@ -2,6 +2,7 @@
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List
 
@@ -14,6 +15,9 @@ from .youtube import YouTubeClient
 
 logger = logging.getLogger(__name__)
 
+# Channels whose recent videos are requested from YouTube at the same time
+CHANNEL_FETCH_WORKERS = 4
+
 
 def check_and_process(db: Database, config: Config) -> Dict:
     """Check for new videos and process them.
@@ -36,14 +40,8 @@ def check_and_process(db: Database, config: Config) -> Dict:
     videos_processed = 0
 
     try:
-        # Initialize clients with proxy support
-        yt_client = YouTubeClient(
-            api_key=config.youtube_api_key,
-            proxy_list=config.proxy_list,
-            proxy_rate_limit=config.proxy_rate_limit,
-            proxy_max_retries=config.proxy_max_retries,
-            proxy_retry_delay=config.proxy_retry_delay,
-        )
+        # Initialize clients
+        yt_client = YouTubeClient(config.youtube_api_key)
         summarizer = Summarizer(
             config.openrouter_api_key,
             config.openrouter_model,
@@ -54,16 +52,26 @@ def check_and_process(db: Database, config: Config) -> Dict:
         logger.info("Checking for new videos from followed channels...")
         channels = db.get_all_channels()
 
+        # The API calls are I/O-bound, so fetch several channels in parallel
+        # (each worker thread gets its own API connection); results are
+        # still saved one channel at a time below
+        with ThreadPoolExecutor(max_workers=CHANNEL_FETCH_WORKERS) as executor:
+            fetches = {
+                channel.id: executor.submit(
+                    yt_client.get_recent_videos,
+                    channel.channel_id,
+                    days_back=config.days_to_look_back,
+                    max_results=config.max_videos_per_check,
+                )
+                for channel in channels
+            }
+
         for channel in channels:
             try:
                 logger.info(f"Checking channel: {channel.channel_name}")
 
                 # Get recent videos
-                videos = yt_client.get_recent_videos(
-                    channel.channel_id,
-                    days_back=config.days_to_look_back,
-                    max_results=config.max_videos_per_check,
-                )
+                videos = fetches[channel.id].result()
 
                 # Add new videos to database
                 for video_data in videos:
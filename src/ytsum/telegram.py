@@ -2,19 +2,117 @@
 
 import logging
 import secrets
-from typing import Optional
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
 from telegram import Update
-from telegram.ext import Application, CommandHandler, ContextTypes
+from telegram.ext import Application, ContextTypes, MessageHandler, filters
+from telegram.request import HTTPXRequest
 
 logger = logging.getLogger(__name__)
 
+# Connection pool size for outgoing Bot API calls (sendMessage etc.)
+SEND_POOL_SIZE = 32
 
-def generate_verification_code() -> str:
-    """Generate a unique verification code for Telegram linking."""
+
+def build_application(token: str) -> Application:
+    """Build a Telegram application with explicitly sized HTTP connection pools.
+
+    Outgoing API calls share one HTTP/2 client with a pool large enough for
+    concurrent sends, while getUpdates (always sequential) gets its own
+    single-connection client so long-polls never hold a send slot.
+
+    Args:
+        token: Bot token from BotFather.
+
+    Returns:
+        Configured (not yet initialized) Application.
+    """
+    send_request = HTTPXRequest(
+        connection_pool_size=SEND_POOL_SIZE,
+        pool_timeout=30.0,
+        connect_timeout=10.0,
+        read_timeout=30.0,
+        http_version="2",
+    )
+    updates_request = HTTPXRequest(connection_pool_size=1, read_timeout=30.0)
+    return (
+        Application.builder()
+        .token(token)
+        .request(send_request)
+        .get_updates_request(updates_request)
+        .build()
+    )
+
+
+def parse_command(text: str) -> Tuple[str, Optional[str], List[str]]:
+    """Split a command message into its command name, target bot and arguments.
+
+    Handles the "/command@BotName arg1 arg2" form Telegram uses in groups.
+
+    Args:
+        text: Message text starting with a bot command.
+
+    Returns:
+        Tuple of (lowercased command without slash or bot name, bot name the
+        command is addressed to or None, list_of_args).
+    """
+    parts = text.split()
+    if not parts:
+        return "", None, []
+    command, _, bot_name = parts[0][1:].partition("@")
+    return command.lower(), bot_name or None, parts[1:]
+
+
+# Pre-generated verification codes, refilled in the background so the
+# account-linking request never waits on the OS random source
+CODE_POOL_SIZE = 64
+_code_pool: Deque[str] = deque()
+_code_pool_lock = threading.Lock()
+_code_pool_refill: Optional[threading.Thread] = None
+
+
+def _new_verification_code() -> str:
+    """Generate a fresh random verification code."""
     return secrets.token_urlsafe(8)[:10].upper()
 
 
+def _refill_code_pool():
+    """Top the code pool back up to CODE_POOL_SIZE."""
+    while len(_code_pool) < CODE_POOL_SIZE:
+        _code_pool.append(_new_verification_code())
+
+
+def _start_code_pool_refill():
+    """Start a background refill unless one is already running."""
+    global _code_pool_refill
+    with _code_pool_lock:
+        if _code_pool_refill is not None and _code_pool_refill.is_alive():
+            return
+        _code_pool_refill = threading.Thread(
+            target=_refill_code_pool, name="telegram-code-pool", daemon=True
+        )
+        _code_pool_refill.start()
+
+
+def generate_verification_code() -> str:
+    """Generate a unique verification code for Telegram linking.
+
+    Codes are taken from a pre-generated pool; if the pool is empty a code is
+    generated inline. A background refill starts once the pool runs low.
+    """
+    try:
+        code = _code_pool.popleft()
+    except IndexError:
+        code = _new_verification_code()
+
+    if len(_code_pool) < CODE_POOL_SIZE // 4:
+        _start_code_pool_refill()
+
+    return code
+
+
 class TelegramBot:
     """Telegram bot for sending notifications."""
 
@@ -28,6 +126,12 @@ class TelegramBot:
         self.token = token
         self.database = database
         self.application: Optional[Application] = None
+        self._commands = {
+            "start": self._handle_start,
+            "help": self._handle_help,
+            "stop": self._handle_stop,
+            "verify": self._handle_verify,
+        }
 
     async def start_bot(self):
         """Start the bot application."""
@@ -36,13 +140,10 @@ class TelegramBot:
             return
 
         try:
-            self.application = Application.builder().token(self.token).build()
-            
-            # Add command handlers
-            self.application.add_handler(CommandHandler("start", self._handle_start))
-            self.application.add_handler(CommandHandler("help", self._handle_help))
-            self.application.add_handler(CommandHandler("stop", self._handle_stop))
-            self.application.add_handler(CommandHandler("verify", self._handle_verify))
+            self.application = build_application(self.token)
+
+            # Single handler for all commands, dispatched by name
+            self.application.add_handler(MessageHandler(filters.COMMAND, self._dispatch))
 
             # Start the bot
             await self.application.initialize()
@@ -59,6 +160,18 @@ class TelegramBot:
             await self.application.shutdown()
             logger.info("Telegram bot stopped")
 
+    async def _dispatch(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Route a command message to its handler."""
+        if not update.message or not update.message.text:
+            return
+        command, bot_name, context.args = parse_command(update.message.text)
+        # In groups, "/command@OtherBot" is meant for a different bot
+        if bot_name and bot_name.lower() != (context.bot.username or "").lower():
+            return
+        handler = self._commands.get(command)
+        if handler:
+            await handler(update, context)
+
     async def _handle_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command - generates verification code."""
         chat_id = update.effective_chat.id
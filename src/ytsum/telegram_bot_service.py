@@ -1,7 +1,8 @@
 """Telegram Bot Service - Runs as a separate container to handle all Telegram communication.
 
 This service acts as a message broker:
-- INCOMING: Polls Telegram API for user commands (/verify, /start, etc.)
+- INCOMING: Receives user commands (/verify, /start, etc.) via webhook, or by
+  polling the Telegram API when no webhook URL is configured
 - OUTGOING: Polls database queue and sends messages to users
 
 Runs continuously in its own Docker container.
@@ -13,12 +14,14 @@ import signal
 import sys
 import time
 from typing import Optional
+from urllib.parse import urlparse
 
 from telegram import Update
-from telegram.ext import Application, CommandHandler, ContextTypes
+from telegram.ext import Application, ContextTypes, MessageHandler, filters
 
 from .config import get_config
 from .database import Database
+from .telegram import build_application, parse_command
 
 logger = logging.getLogger(__name__)
 
@@ -26,19 +29,42 @@ logger = logging.getLogger(__name__)
 class TelegramBotService:
     """Telegram bot service that handles both incoming and outgoing messages."""
 
-    def __init__(self, token: str, database: Database):
+    def __init__(
+        self,
+        token: str,
+        database: Database,
+        webhook_url: str = "",
+        webhook_secret: str = "",
+        webhook_listen: str = "0.0.0.0",
+        webhook_port: int = 8443,
+    ):
         """Initialize the Telegram bot service.
 
         Args:
             token: Bot token from BotFather.
             database: Database instance for storing queue and linking users.
+            webhook_url: Public HTTPS URL for Telegram to push updates to.
+                If empty, the service falls back to polling.
+            webhook_secret: Secret token Telegram sends with each webhook request.
+            webhook_listen: Address the webhook receiver binds to.
+            webhook_port: Port the webhook receiver listens on.
         """
         self.token = token
         self.database = database
+        self.webhook_url = webhook_url
+        self.webhook_secret = webhook_secret
+        self.webhook_listen = webhook_listen
+        self.webhook_port = webhook_port
         self.application: Optional[Application] = None
         self.running = False
         self.outgoing_task = None
         self._shutdown_event = asyncio.Event()
+        self._commands = {
+            "start": self._handle_start,
+            "help": self._handle_help,
+            "stop": self._handle_stop,
+            "verify": self._handle_verify,
+        }
 
     async def start(self):
         """Start the Telegram bot service with both incoming and outgoing handlers."""
@@ -48,26 +74,36 @@ class TelegramBotService:
 
         try:
             logger.info("Initializing Telegram bot application...")
-            self.application = Application.builder().token(self.token).build()
+            self.application = build_application(self.token)
 
-            # Add command handlers for incoming messages
-            self.application.add_handler(CommandHandler("start", self._handle_start))
-            self.application.add_handler(CommandHandler("help", self._handle_help))
-            self.application.add_handler(CommandHandler("stop", self._handle_stop))
-            self.application.add_handler(CommandHandler("verify", self._handle_verify))
+            # Single handler for all incoming commands, dispatched by name
+            self.application.add_handler(MessageHandler(filters.COMMAND, self._dispatch))
 
             # Initialize and start the application
             await self.application.initialize()
             await self.application.start()
 
-            # Start polling for incoming messages
-            logger.info("Starting incoming message polling...")
-            await self.application.updater.start_polling(
-                poll_interval=1.0,
-                timeout=10,
-                bootstrap_retries=-1,  # Retry forever
-                drop_pending_updates=True  # Don't process old updates on restart
-            )
+            if self.webhook_url:
+                # Let Telegram push updates to us instead of polling getUpdates
+                logger.info(f"Starting incoming webhook on port {self.webhook_port}...")
+                await self.application.updater.start_webhook(
+                    listen=self.webhook_listen,
+                    port=self.webhook_port,
+                    url_path=urlparse(self.webhook_url).path.lstrip("/"),
+                    webhook_url=self.webhook_url,
+                    secret_token=self.webhook_secret or None,
+                    bootstrap_retries=-1,  # Retry forever
+                    drop_pending_updates=True  # Don't process old updates on restart
+                )
+            else:
+                # Fall back to polling (e.g. local development without a public URL)
+                logger.info("Starting incoming message polling...")
+                await self.application.updater.start_polling(
+                    poll_interval=1.0,
+                    timeout=10,
+                    bootstrap_retries=-1,  # Retry forever
+                    drop_pending_updates=True  # Don't process old updates on restart
+                )
 
             # Start outgoing message processor in background
             logger.info("Starting outgoing message processor...")
@@ -101,7 +137,7 @@ class TelegramBotService:
                     pass
                 logger.info("Outgoing message processor stopped")
 
-            # Stop polling and application
+            # Stop polling/webhook and application
             if self.application:
                 await self.application.updater.stop()
                 await self.application.stop()
@@ -163,6 +199,20 @@ class TelegramBotService:
                 logger.error(f"Error in outgoing message processor: {e}", exc_info=True)
                 await asyncio.sleep(5)  # Wait before retrying
 
+    async def _dispatch(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Route an incoming command message to its handler."""
+        if not update.message or not update.message.text:
+            return
+        command, bot_name, context.args = parse_command(update.message.text)
+        # In groups, "/command@OtherBot" is meant for a different bot
+        if bot_name and bot_name.lower() != (context.bot.username or "").lower():
+            return
+        handler = self._commands.get(command)
+        if handler:
+            await handler(update, context)
+        else:
+            logger.info(f"Ignoring unknown command /{command} from chat {update.effective_chat.id}")
+
     async def _handle_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command."""
         logger.info(f"Received /start from chat {update.effective_chat.id}")
@@ -295,7 +345,14 @@ async def run_telegram_bot_service():
     logger.info("✅ Database connected")
 
     # Create and start bot service
-    service = TelegramBotService(config.telegram_bot_token, database)
+    service = TelegramBotService(
+        config.telegram_bot_token,
+        database,
+        webhook_url=config.telegram_webhook_url,
+        webhook_secret=config.telegram_webhook_secret,
+        webhook_listen=config.telegram_webhook_listen,
+        webhook_port=config.telegram_webhook_port,
+    )
 
     # Setup signal handlers for graceful shutdown
     def signal_handler(signum, frame):
@@ -1,12 +1,14 @@
 """Terminal User Interface for ytsum using Textual."""
 
 from datetime import datetime
+from functools import cache, cached_property
 from typing import Optional
 
 from rich.table import Table
-from textual import on
+from textual import on, work
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
+from textual.message import Message
 from textual.screen import ModalScreen, Screen
 from textual.widgets import (
     Button,
@@ -21,10 +23,46 @@ from textual.widgets import (
     TabPane,
 )
 
-from sqlalchemy.orm import joinedload
-
 from .config import get_config
-from .database import Channel, Database, Video
+from .database import Database, Summary
+from .youtube import YouTubeClient
+
+
+def _sync_table(table: DataTable, rows: dict[str, tuple], row_cache: dict[str, tuple]) -> dict[str, tuple]:
+    """Update a DataTable to show rows, only touching what changed.
+
+    Rows no longer present are removed and changed cells are updated in place.
+    DataTable can only append rows, so if new keys appear or the order changes
+    the table is rebuilt instead.
+
+    Args:
+        table: Table to update.
+        rows: Ordered mapping of row key to cell values.
+        row_cache: The rows currently shown, as returned by the previous call.
+
+    Returns:
+        The new row cache to pass to the next call.
+    """
+    kept_keys = [key for key in row_cache if key in rows]
+    if kept_keys != list(rows):
+        table.clear()
+        for key, cells in rows.items():
+            table.add_row(*cells, key=key)
+        return dict(rows)
+
+    for key in row_cache.keys() - rows.keys():
+        table.remove_row(key)
+
+    column_keys = list(table.columns)
+    for key, cells in rows.items():
+        old_cells = row_cache[key]
+        if old_cells == cells:
+            continue
+        for column_key, old_value, value in zip(column_keys, old_cells, cells):
+            if old_value != value:
+                table.update_cell(key, column_key, value)
+
+    return dict(rows)
 
 
 class SummaryScreen(ModalScreen):
@@ -47,36 +85,29 @@ class SummaryScreen(ModalScreen):
 
     def compose(self) -> ComposeResult:
         """Create the summary display."""
-        # Build markdown content
-        key_points_md = "\n".join([f"{i}. {point}" for i, point in enumerate(self.key_points, 1)])
+        key_points_md = self._build_key_points_markdown()
 
-        content = f"""# {self.video_title}
-
-**Channel:** {self.channel}
-**Published:** {self.published}
-**URL:** {self.url}
-
----
-
-## Summary
-
-{self.summary}
-
----
-
-## Key Points
-
-{key_points_md}
-
----
-
-*Press ESC or Q to close*
-"""
+        # Plain labels for the metadata; Markdown only where formatting matters
         with Container(id="summary_container"):
             with VerticalScroll():
-                yield Markdown(content, id="summary_markdown")
+                yield Label(self.video_title, classes="summary-title", markup=False)
+                yield Label(f"Channel: {self.channel}", markup=False)
+                yield Label(f"Published: {self.published}", markup=False)
+                yield Label(f"URL: {self.url}", markup=False)
+                yield Label("Summary", classes="section-title")
+                yield Markdown(self.summary, id="summary_markdown")
+                yield Label("Key Points", classes="section-title")
+                yield Markdown(key_points_md, id="key_points_markdown")
+                yield Label("Press ESC or Q to close", classes="hint")
             yield Button("Close", variant="primary", id="close_btn")
 
+    def _build_key_points_markdown(self) -> str:
+        """Build the numbered markdown list of key points."""
+        lines = []
+        for i, point in enumerate(self.key_points, 1):
+            lines.append(f"{i}. {point}")
+        return "\n".join(lines)
+
     @on(Button.Pressed, "#close_btn")
     def close_summary(self):
         """Close the summary screen."""
@@ -87,13 +118,31 @@ class SummaryScreen(ModalScreen):
         self.dismiss()
 
 
-class StatsPanel(Static):
+# (label, widget id) for each metric shown in the stats panel
+STAT_ROWS = [
+    ("Total Channels", "total_channels"),
+    ("Total Videos", "total_videos"),
+    ("With Transcripts", "videos_with_transcripts"),
+    ("With Summaries", "videos_with_summaries"),
+    ("Total Runs", "total_runs"),
+    ("Last Run", "last_run"),
+]
+
+
+class StatsPanel(Vertical):
     """Display statistics panel."""
 
     def __init__(self, db: Database):
         super().__init__()
         self.db = db
 
+    def compose(self) -> ComposeResult:
+        """Create one label/value row per metric."""
+        for name, stat_id in STAT_ROWS:
+            with Horizontal(classes="stat-row", id=f"{stat_id}_row"):
+                yield Label(name, classes="stat-name")
+                yield Static("", classes="stat-value", id=stat_id)
+
     def on_mount(self) -> None:
         """Update stats when mounted."""
         self.update_stats()
@@ -102,21 +151,16 @@ class StatsPanel(Static):
         """Update the statistics display."""
         stats = self.db.get_stats()
 
-        table = Table(show_header=False, box=None, padding=(0, 2))
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", style="green")
-
-        table.add_row("Total Channels", str(stats["total_channels"]))
-        table.add_row("Total Videos", str(stats["total_videos"]))
-        table.add_row("With Transcripts", str(stats["videos_with_transcripts"]))
-        table.add_row("With Summaries", str(stats["videos_with_summaries"]))
-        table.add_row("Total Runs", str(stats["total_runs"]))
+        for _, stat_id in STAT_ROWS[:-1]:
+            self.query_one(f"#{stat_id}", Static).update(str(stats[stat_id]))
 
+        last_run_row = self.query_one("#last_run_row")
         if stats["last_run"]:
             last_run_time = stats["last_run"].run_timestamp.strftime("%Y-%m-%d %H:%M")
-            table.add_row("Last Run", last_run_time)
-
-        self.update(table)
+            self.query_one("#last_run", Static).update(last_run_time)
+            last_run_row.display = True
+        else:
+            last_run_row.display = False
 
 
 class ChannelsTab(VerticalScroll):
@@ -125,6 +169,7 @@ class ChannelsTab(VerticalScroll):
     def __init__(self, db: Database):
         super().__init__()
         self.db = db
+        self._row_cache: dict[str, tuple] = {}
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -136,6 +181,11 @@ class ChannelsTab(VerticalScroll):
         yield Label("Followed Channels", classes="section-title")
         yield DataTable(id="channels_table")
 
+    @cached_property
+    def yt_client(self):
+        """YouTube client shared by all add-channel lookups from this tab."""
+        return YouTubeClient(get_config().youtube_api_key)
+
     def on_mount(self) -> None:
         """Set up the channels table when mounted."""
         table = self.query_one("#channels_table", DataTable)
@@ -145,22 +195,22 @@ class ChannelsTab(VerticalScroll):
     def refresh_channels(self) -> None:
         """Refresh the channels list."""
         table = self.query_one("#channels_table", DataTable)
-        table.clear()
+        channels = self.db.get_channels_view()
 
-        channels = self.db.get_all_channels()
-        for channel in channels:
-            last_checked = (
-                channel.last_checked.strftime("%Y-%m-%d %H:%M")
-                if channel.last_checked
-                else "Never"
-            )
-            table.add_row(
-                channel.channel_name,
-                channel.channel_id,
-                channel.added_date.strftime("%Y-%m-%d"),
-                last_checked,
-                key=channel.channel_id,
-            )
+        rows = {}
+        for name, channel_id, added, last_checked in channels:
+            rows[channel_id] = (name, channel_id, added, last_checked or "Never")
+
+        # Repaint once for the whole table rather than once per row
+        with self.app.batch_update():
+            self._row_cache = _sync_table(table, rows, self._row_cache)
+
+    class ChannelAdded(Message):
+        """Posted by the add-channel worker once a channel has been saved."""
+
+        def __init__(self, channel_name: str):
+            super().__init__()
+            self.channel_name = channel_name
 
     @on(Button.Pressed, "#add_channel_btn")
     def add_channel(self) -> None:
@@ -172,36 +222,48 @@ class ChannelsTab(VerticalScroll):
             self.notify("Please enter a channel URL or ID", severity="warning")
             return
 
-        # Import here to avoid circular dependencies
-        from .youtube import YouTubeClient
+        self.notify("Fetching channel information...", timeout=2)
+        self._add_channel_worker(channel_identifier)
 
-        config = get_config()
-        yt_client = YouTubeClient(config.youtube_api_key)
+    @work(thread=True, exclusive=True, group="add_channel", exit_on_error=False)
+    def _add_channel_worker(self, channel_identifier: str) -> None:
+        """Look up and save a channel off the UI thread."""
+        try:
+            yt_client = self.yt_client
 
-        # Extract channel ID if it's a URL
-        channel_id = yt_client.extract_channel_id(channel_identifier)
-        if not channel_id:
-            channel_id = channel_identifier
+            # Extract channel ID if it's a URL
+            channel_id = yt_client.extract_channel_id(channel_identifier)
+            if not channel_id:
+                channel_id = channel_identifier
 
-        # Get channel info
-        self.notify("Fetching channel information...", timeout=2)
-        channel_info = yt_client.get_channel_info(channel_id)
+            # Get channel info
+            channel_info = yt_client.get_channel_info(channel_id)
 
-        if not channel_info:
-            self.notify("Channel not found. Please check the URL or ID.", severity="error")
-            return
+            if not channel_info:
+                self.app.call_from_thread(
+                    self.notify, "Channel not found. Please check the URL or ID.", severity="error"
+                )
+                return
 
-        # Add to database
-        result = self.db.add_channel(
-            channel_info["id"], channel_info["name"], channel_info["url"]
-        )
+            # Add to database
+            result = self.db.add_channel(
+                channel_info["id"], channel_info["name"], channel_info["url"]
+            )
+        except Exception as e:
+            self.app.call_from_thread(self.notify, f"Error adding channel: {e}", severity="error")
+            return
 
         if result:
-            self.notify(f"Added channel: {channel_info['name']}", severity="information")
-            input_widget.value = ""
-            self.refresh_channels()
+            self.post_message(self.ChannelAdded(channel_info["name"]))
         else:
-            self.notify("Channel already exists", severity="warning")
+            self.app.call_from_thread(self.notify, "Channel already exists", severity="warning")
+
+    @on(ChannelAdded)
+    def on_channel_added(self, event: ChannelAdded) -> None:
+        """Refresh the table after the worker has saved a channel."""
+        self.notify(f"Added channel: {event.channel_name}", severity="information")
+        self.query_one("#channel_input", Input).value = ""
+        self.refresh_channels()
 
     @on(DataTable.RowSelected, "#channels_table")
     def on_channel_selected(self, event: DataTable.RowSelected) -> None:
@@ -214,9 +276,18 @@ class ChannelsTab(VerticalScroll):
 class VideosTab(VerticalScroll):
     """Tab for browsing videos and summaries."""
 
+    # Videos loaded per page; the next page loads when the cursor reaches the end
+    PAGE_SIZE = 50
+
     def __init__(self, db: Database):
         super().__init__()
         self.db = db
+        # SummaryScreen arguments for the listed videos that have a summary
+        self._summary_cache: dict[int, dict] = {}
+        self._row_cache: dict[str, tuple] = {}
+        # Video IDs in table order, so the cursor row maps straight to a video
+        self._row_keys: list[int] = []
+        self._all_loaded = False
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -236,23 +307,68 @@ class VideosTab(VerticalScroll):
         self.refresh_videos()
 
     def refresh_videos(self) -> None:
-        """Refresh the videos list."""
+        """Refresh the videos list, keeping as many pages as are already loaded."""
         table = self.query_one("#videos_table", DataTable)
-        table.clear()
+        limit = max(len(self._row_cache), self.PAGE_SIZE)
+        videos = self.db.get_recent_videos_view(limit=limit)
+        self._all_loaded = len(videos) < limit
+        self._summary_cache = {}
+        rows = self._build_rows(videos)
+
+        # Repaint once for the whole table rather than once per row
+        with self.app.batch_update():
+            self._row_cache = _sync_table(table, rows, self._row_cache)
+        self._row_keys = [int(key) for key in self._row_cache]
+
+    def load_next_page(self) -> None:
+        """Append the next page of older videos to the table."""
+        if self._all_loaded:
+            return
 
-        videos = self.db.get_recent_videos(limit=50)
+        table = self.query_one("#videos_table", DataTable)
+        videos = self.db.get_recent_videos_view(
+            limit=self.PAGE_SIZE, offset=len(self._row_cache)
+        )
+        self._all_loaded = len(videos) < self.PAGE_SIZE
+        rows = self._build_rows(videos)
+
+        with self.app.batch_update():
+            for key, cells in rows.items():
+                # Skip rows shifted into this page by videos added since the last refresh
+                if key not in self._row_cache:
+                    table.add_row(*cells, key=key)
+                    self._row_cache[key] = cells
+                    self._row_keys.append(int(key))
+
+    def _build_rows(self, videos: list) -> dict[str, tuple]:
+        """Build table rows for videos and cache their summaries."""
+        rows = {}
         for video in videos:
-            has_summary = "✓" if video.summary else "✗"
-            # Truncate long titles
-            title = video.title[:60] + "..." if len(video.title) > 60 else video.title
-            table.add_row(
-                title,
-                video.channel.channel_name,
-                video.published_at.strftime("%Y-%m-%d"),
-                has_summary,
-                key=str(video.id),
+            rows[str(video.id)] = (
+                video.title_display,
+                video.channel_name,
+                video.published,
+                "✓" if video.has_summary else "✗",
             )
 
+            if video.has_summary:
+                self._summary_cache[video.id] = {
+                    "title": video.title,
+                    "channel": video.channel_name,
+                    "published": video.published,
+                    "url": video.url,
+                    "summary": video.summary_text,
+                    "key_points": Summary.parse_key_points(video.key_points),
+                }
+
+        return rows
+
+    @on(DataTable.RowHighlighted, "#videos_table")
+    def on_video_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Load the next page when the cursor reaches the last row."""
+        if event.cursor_row >= event.data_table.row_count - 1:
+            self.load_next_page()
+
     @on(Button.Pressed, "#refresh_videos_btn")
     def on_refresh_pressed(self) -> None:
         """Handle refresh button press."""
@@ -265,10 +381,8 @@ class VideosTab(VerticalScroll):
         table = self.query_one("#videos_table", DataTable)
         if table.cursor_row is not None:
             try:
-                rows = list(table.rows.keys())
-                if table.cursor_row < len(rows):
-                    row_key = rows[table.cursor_row]
-                    video_id = int(row_key.value)
+                if table.is_valid_row_index(table.cursor_row):
+                    video_id = self._row_keys[table.cursor_row]
                     self.show_video_summary(video_id)
             except Exception as e:
                 self.notify(f"Error: {e}", severity="error")
@@ -277,47 +391,32 @@ class VideosTab(VerticalScroll):
 
     def show_video_summary(self, video_id: int) -> None:
         """Display summary for a video."""
-        with self.db.get_session() as session:
-            # Eagerly load relationships before closing session
-            video = (
-                session.query(Video)
-                .options(joinedload(Video.channel), joinedload(Video.summary))
-                .filter_by(id=video_id)
-                .first()
-            )
+        cached = self._summary_cache.get(video_id)
+        if cached:
+            self.app.push_screen(SummaryScreen(**cached))
+            return
 
-            if not video:
-                self.notify("Video not found", severity="error")
-                return
+        # Not in the listed videos - load just the columns we show
+        video = self.db.get_video_summary_view(video_id)
 
-            # Check if summary exists before expunging
-            has_summary = video.summary is not None
-
-            if has_summary:
-                # Access all data we need before expunging
-                title = video.title
-                channel_name = video.channel.channel_name
-                published = video.published_at.strftime('%Y-%m-%d')
-                url = video.url
-                summary_text = video.summary.summary_text
-                key_points = video.summary.get_key_points()
-
-                # Now expunge
-                session.expunge_all()
-
-                # Push the summary screen
-                self.app.push_screen(
-                    SummaryScreen(
-                        title=title,
-                        channel=channel_name,
-                        published=published,
-                        url=url,
-                        summary=summary_text,
-                        key_points=key_points
-                    )
-                )
-            else:
-                self.notify("No summary available for this video", severity="warning", timeout=3)
+        if not video:
+            self.notify("Video not found", severity="error")
+            return
+
+        if not video.has_summary:
+            self.notify("No summary available for this video", severity="warning", timeout=3)
+            return
+
+        self.app.push_screen(
+            SummaryScreen(
+                title=video.title,
+                channel=video.channel_name,
+                published=video.published,
+                url=video.url,
+                summary=video.summary_text,
+                key_points=Summary.parse_key_points(video.key_points),
+            )
+        )
 
     @on(DataTable.RowSelected, "#videos_table")
     def on_video_selected(self, event: DataTable.RowSelected) -> None:
@@ -338,6 +437,7 @@ class HistoryTab(VerticalScroll):
     def __init__(self, db: Database):
         super().__init__()
         self.db = db
+        self._row_cache: dict[str, tuple] = {}
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -354,21 +454,24 @@ class HistoryTab(VerticalScroll):
     def refresh_history(self) -> None:
         """Refresh the run history."""
         table = self.query_one("#history_table", DataTable)
-        table.clear()
-
-        history = self.db.get_run_history(limit=30)
-        for run in history:
-            status = "✓ Success" if run.success else "✗ Failed"
-            duration = str(run.duration_seconds) if run.duration_seconds else "N/A"
-            table.add_row(
-                run.run_timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-                str(run.videos_found),
-                str(run.videos_processed),
+        history = self.db.get_history_view(limit=30)
+
+        rows = {}
+        for run_id, run_time, found, processed, duration_seconds, success in history:
+            status = "✓ Success" if success else "✗ Failed"
+            duration = str(duration_seconds) if duration_seconds else "N/A"
+            rows[str(run_id)] = (
+                run_time,
+                str(found),
+                str(processed),
                 duration,
                 status,
-                key=str(run.id),
             )
 
+        # Repaint once for the whole table rather than once per row
+        with self.app.batch_update():
+            self._row_cache = _sync_table(table, rows, self._row_cache)
+
     @on(Button.Pressed, "#refresh_history_btn")
     def on_refresh_pressed(self) -> None:
         """Handle refresh button press."""
@@ -376,6 +479,26 @@ class HistoryTab(VerticalScroll):
         self.notify("History refreshed", timeout=1)
 
 
+@cache
+def _build_settings_table() -> Table:
+    """Build the configuration table once; config doesn't change while the TUI runs.
+
+    Call _build_settings_table.cache_clear() after reloading the config.
+    """
+    config_dict = get_config().to_dict()
+
+    table = Table(show_header=True, box=None)
+    table.add_column("Setting", style="cyan")
+    table.add_column("Value", style="yellow")
+
+    for key, value in config_dict.items():
+        # Format keys nicely
+        display_key = key.replace("_", " ").title()
+        table.add_row(display_key, str(value))
+
+    return table
+
+
 class SettingsTab(VerticalScroll):
     """Tab for viewing settings."""
 
@@ -385,20 +508,7 @@ class SettingsTab(VerticalScroll):
     def compose(self) -> ComposeResult:
         """Create child widgets."""
         yield Label("Configuration", classes="section-title")
-
-        config = get_config()
-        config_dict = config.to_dict()
-
-        table = Table(show_header=True, box=None)
-        table.add_column("Setting", style="cyan")
-        table.add_column("Value", style="yellow")
-
-        for key, value in config_dict.items():
-            # Format keys nicely
-            display_key = key.replace("_", " ").title()
-            table.add_row(display_key, str(value))
-
-        yield Static(table)
+        yield Static(_build_settings_table())
 
 
 class MainScreen(Screen):
@@ -495,11 +605,26 @@ class YTSumApp(App):
     }
 
     StatsPanel {
+        height: auto;
         padding: 1;
         border: solid $primary;
         margin: 1;
     }
 
+    .stat-row {
+        height: 1;
+    }
+
+    .stat-name {
+        width: 20;
+        color: cyan;
+    }
+
+    .stat-value {
+        width: auto;
+        color: green;
+    }
+
     SummaryScreen {
         align: center middle;
     }
@@ -518,8 +643,14 @@ class YTSumApp(App):
         margin-bottom: 1;
     }
 
-    #summary_markdown {
-        padding: 1;
+    .summary-title {
+        text-style: bold;
+        color: $accent;
+        padding: 1 0;
+    }
+
+    #summary_markdown, #key_points_markdown {
+        padding: 0 1;
     }
 
     #close_btn {
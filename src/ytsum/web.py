@@ -1,15 +1,32 @@
 """Web interface for ytsum using Flask."""
 
+import base64
+import binascii
 import logging
+import os
+import secrets
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, abort
+from pathlib import Path
+
+import orjson
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, abort, stream_template
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+from flask_wtf.csrf import CSRFError, CSRFProtect
+from werkzeug.middleware.proxy_fix import ProxyFix
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
-from sqlalchemy.orm import joinedload
+from gunicorn.app.base import BaseApplication
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import tuple_
 from functools import wraps
 
 from .config import get_config
-from .database import YouTubeChannel, Database, Video, User
+from .database import YouTubeChannel, Database, Summary, Video, User
+from .forms import AddChannelForm, LoginForm, RegisterForm, parse_form
 from .youtube import YouTubeClient
 from .telegram import generate_verification_code
 
@@ -27,25 +44,176 @@ def admin_required(f):
     return decorated_function
 
 
+def encode_page_cursor(video):
+    """Build an opaque keyset pagination cursor for a video row.
+
+    Args:
+        video: Video at the edge of the current page.
+
+    Returns:
+        URL-safe token encoding the video's (published_at, id).
+    """
+    raw = f"{video.published_at.isoformat()}|{video.id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def parse_page_cursor(args, name):
+    """Read a keyset pagination cursor from the query string.
+
+    Args:
+        args: Request query arguments.
+        name: Cursor parameter ("after" or "before").
+
+    Returns:
+        Tuple of (published_at, video id), or None if the cursor isn't set.
+    """
+    token = args.get(name)
+    if not token:
+        return None
+
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        published, video_id = raw.split("|")
+        return (datetime.fromisoformat(published), int(video_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        abort(400)
+
+
+def load_secret_key(key_file: Path) -> bytes:
+    """Read the app's secret key from disk, creating it on first run.
+
+    Safe to call from several workers starting at once: the key is written
+    to a temporary file and linked into place, so exactly one key wins.
+
+    Args:
+        key_file: Where the key is stored.
+
+    Returns:
+        The secret key.
+    """
+    if key_file.exists():
+        return key_file.read_bytes()
+
+    tmp_file = key_file.with_name(f"{key_file.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(secrets.token_bytes(32))
+
+    try:
+        os.link(tmp_file, key_file)
+    except FileExistsError:
+        # Another worker created the key first; use theirs
+        pass
+    finally:
+        tmp_file.unlink()
+
+    return key_file.read_bytes()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson.
+
+    Dates are passed through to Flask's default handler so responses keep
+    the same format as with the stdlib encoder.
+    """
+
+    def _options(self, indent=False):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, default=self.default, option=self._options(kwargs.get("indent"))
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._options(indent)),
+            mimetype=self.mimetype,
+        )
+
+
 def create_app(db_path=None):
     """Create and configure the Flask application."""
-    import os
-    import secrets
-    
     app = Flask(__name__)
-    # Generate a random secret key if not provided via environment variable
-    app.secret_key = os.environ.get("FLASK_SECRET_KEY", secrets.token_hex(32))
+    app.json = OrjsonProvider(app)
+    # Share compiled templates between workers and across restarts (kept in
+    # a per-user directory under the system temp dir)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
+    # Compress HTML and JSON responses (streamed pages included)
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    app.config["COMPRESS_MIN_SIZE"] = 500
+    Compress(app)
+    # Every form POST must carry the session's CSRF token
+    csrf = CSRFProtect(app)
+
+    # Load config
+    config = get_config()
+
+    # Behind a reverse proxy the connecting address is the proxy's; take
+    # the client's from the headers set by the trusted proxies instead
+    if config.trusted_proxies:
+        app.wsgi_app = ProxyFix(
+            app.wsgi_app, x_for=config.trusted_proxies, x_proto=config.trusted_proxies
+        )
+
+    # Per-client rate limits for expensive endpoints. Counters are kept per
+    # worker unless RATELIMIT_STORAGE_URI points at a shared backend.
+    limiter = Limiter(
+        get_remote_address, app=app, storage_uri=config.ratelimit_storage_uri
+    )
 
     # Initialize Flask-Login
     login_manager = LoginManager()
     login_manager.login_view = "login"
     login_manager.init_app(app)
 
-    # Load config
-    config = get_config()
-
     # Initialize database
-    db = Database(db_path or config.database_path)
+    db_path = db_path or config.database_path
+    db = Database(db_path)
+
+    # Use the configured secret key, or one kept next to the database so
+    # sessions survive restarts and are shared by all workers
+    app.secret_key = os.environ.get("FLASK_SECRET_KEY") or load_secret_key(
+        Path(db_path).parent / "secret_key"
+    )
+
+    # One YouTube client for all requests, so API connections are reused
+    yt_client = YouTubeClient(config.youtube_api_key)
+
+    # Manual runs execute on a background thread so /run returns right away.
+    # Their status is kept in the database, where any worker can read it and
+    # where starting a run fails while another is active, so the same
+    # videos are never summarized twice.
+    run_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ytsum-run")
+
+    def run_job(job_id):
+        """Run a check and record how it ended."""
+        from .scheduler import check_and_process
+
+        outcome = {"error": "The run stopped unexpectedly"}
+        try:
+            outcome = {"result": check_and_process(db, config)}
+        except Exception as e:
+            logger.error(f"Run {job_id} failed: {e}", exc_info=True)
+            outcome = {"error": str(e)}
+        finally:
+            # Always close the job, or it would block manual runs until it
+            # times out
+            try:
+                db.finish_run_job(job_id, **outcome)
+            except Exception:
+                logger.exception(f"Could not record the outcome of run {job_id}")
 
     # Telegram bot runs in a separate container, no need to start here
 
@@ -54,16 +222,18 @@ def create_app(db_path=None):
         return db.get_user(int(user_id))
 
     @app.route("/login", methods=["GET", "POST"])
+    # Each attempt costs an argon2 hash, so cap them to keep password
+    # guessing from tying up the server
+    @limiter.limit("10 per minute", methods=["POST"])
     def login():
         if current_user.is_authenticated:
             return redirect(url_for("index"))
         
         if request.method == "POST":
-            username = request.form.get("username")
-            password = request.form.get("password")
-            user = db.get_user_by_username(username)
+            form = parse_form(LoginForm, request.form)
+            user = db.authenticate_user(form.username, form.password) if form else None
             
-            if user and user.check_password(password):
+            if user:
                 login_user(user)
                 next_page = request.args.get("next")
                 return redirect(next_page or url_for("index"))
@@ -77,15 +247,14 @@ def create_app(db_path=None):
             return redirect(url_for("index"))
             
         if request.method == "POST":
-            username = request.form.get("username")
-            password = request.form.get("password")
+            form = parse_form(RegisterForm, request.form)
             
-            if not username or not password:
+            if form is None:
                 flash("Username and password are required", "warning")
-            elif db.get_user_by_username(username):
+            elif db.get_user_by_username(form.username):
                 flash("Username already exists", "warning")
             else:
-                db.add_user(username, password)
+                db.add_user(form.username, form.password)
                 flash("Registration successful! Please login.", "success")
                 return redirect(url_for("login"))
                 
@@ -101,44 +270,35 @@ def create_app(db_path=None):
     @login_required
     def index():
         """Dashboard page."""
-        # TODO: Update get_stats to support user_id
-        stats = db.get_stats(user_id=current_user.id)
-
-        # Get recent summaries
-        recent_summaries = db.get_summaries_with_videos(limit=10, user_id=current_user.id)
+        # Stats and recent summaries, from one database session
+        dashboard = db.get_dashboard(user_id=current_user.id, limit=10)
 
         return render_template(
             "dashboard.html",
-            stats=stats,
-            recent_summaries=recent_summaries,
+            stats=dashboard["stats"],
+            recent_summaries=dashboard["recent_summaries"],
         )
 
     @app.route("/channels")
     @login_required
     def channels():
         """Channels management page."""
-        channels_list = db.get_all_channels(user_id=current_user.id)
+        channels_list = db.get_channels_with_video_counts(current_user.id)
         return render_template("channels.html", channels=channels_list)
 
     @app.route("/channels/add", methods=["POST"])
     @login_required
     def add_channel():
         """Add a new channel."""
-        channel_input = request.form.get("channel_input", "").strip()
+        form = parse_form(AddChannelForm, request.form)
 
-        if not channel_input:
+        if form is None:
             flash("Please enter a channel URL or ID", "warning")
             return redirect(url_for("channels"))
 
-        try:
-            yt_client = YouTubeClient(
-                api_key=config.youtube_api_key,
-                proxy_list=config.proxy_list,
-                proxy_rate_limit=config.proxy_rate_limit,
-                proxy_max_retries=config.proxy_max_retries,
-                proxy_retry_delay=config.proxy_retry_delay,
-            )
+        channel_input = form.channel_input
 
+        try:
             # Extract channel ID if it's a URL
             channel_id = yt_client.extract_channel_id(channel_input)
             if not channel_id:
@@ -190,46 +350,80 @@ def create_app(db_path=None):
         search = request.args.get("search", "").strip()
         has_summary = request.args.get("has_summary", "all")
         channel_filter = request.args.get("channel", "all")
-        page = int(request.args.get("page", 1))
+        # Keyset pagination: a page starts just past the (published_at, id)
+        # of the last row shown, so deep pages cost the same as the first
+        after = parse_page_cursor(request.args, "after")
+        before = parse_page_cursor(request.args, "before")
         per_page = 50
 
         # Get all channels for the dropdown
-        all_channels = db.get_all_channels(user_id=current_user.id)
+        all_channels = db.get_channel_choices(current_user.id)
 
         # Get videos
         with db.get_session() as session:
+            # Select just the columns the list shows, as plain rows; the
+            # summary is only checked for presence
             query = (
-                session.query(Video)
+                session.query(
+                    Video.id,
+                    Video.title,
+                    Video.url,
+                    Video.published_at,
+                    YouTubeChannel.channel_name,
+                    Summary.id.isnot(None).label("has_summary"),
+                )
                 .join(Video.youtube_channel)
                 .join(YouTubeChannel.users)
+                .outerjoin(Video.summary)
                 .filter(User.id == current_user.id)
-                .options(joinedload(Video.youtube_channel), joinedload(Video.summary))
-                .order_by(Video.published_at.desc())
             )
 
             # Apply filters (case-insensitive)
             if search:
-                search_pattern = f"%{search}%"
-                query = query.filter(
-                    (Video.title.ilike(search_pattern)) |
-                    (Video.youtube_channel.has(YouTubeChannel.channel_name.ilike(search_pattern)))
-                )
+                query = query.filter(db.video_search_filter(search))
 
             if channel_filter != "all":
                 # Ensure the filtered channel belongs to the user (implicit via above join, but good to check)
                 query = query.filter(Video.youtube_channel_id == int(channel_filter))
 
+            # Summaries are outer-joined above, so test the joined row
             if has_summary == "yes":
-                query = query.filter(Video.summary.has())
+                query = query.filter(Summary.id.isnot(None))
             elif has_summary == "no":
-                query = query.filter(~Video.summary.has())
-
-            # Pagination
-            total = query.count()
-            videos_list = query.offset((page - 1) * per_page).limit(per_page).all()
-            session.expunge_all()
-
-        total_pages = (total + per_page - 1) // per_page
+                query = query.filter(Summary.id.is_(None))
+
+            # Fetch one extra row to tell whether another page follows
+            sort_key = tuple_(Video.published_at, Video.id)
+            if before:
+                # Going back to newer videos: read upwards from the cursor, then flip
+                rows = (
+                    query.filter(sort_key > before)
+                    .order_by(Video.published_at.asc(), Video.id.asc())
+                    .limit(per_page + 1)
+                    .all()
+                )
+                has_newer = len(rows) > per_page
+                has_older = True
+                videos_list = rows[:per_page][::-1]
+            else:
+                if after:
+                    query = query.filter(sort_key < after)
+                rows = (
+                    query.order_by(Video.published_at.desc(), Video.id.desc())
+                    .limit(per_page + 1)
+                    .all()
+                )
+                has_newer = after is not None
+                has_older = len(rows) > per_page
+                videos_list = rows[:per_page]
+
+        if not videos_list and (after or before):
+            # Nothing is left past the cursor (e.g. videos were removed in
+            # another tab), so start again from the first page
+            args = request.args.to_dict()
+            args.pop("after", None)
+            args.pop("before", None)
+            return redirect(url_for("videos", **args))
 
         return render_template(
             "videos.html",
@@ -238,97 +432,66 @@ def create_app(db_path=None):
             search=search,
             has_summary=has_summary,
             channel_filter=channel_filter,
-            page=page,
-            total_pages=total_pages,
+            newer_cursor=encode_page_cursor(videos_list[0]) if has_newer else None,
+            older_cursor=encode_page_cursor(videos_list[-1]) if has_older else None,
         )
 
     @app.route("/summary/<int:video_id>")
     @login_required
     def summary(video_id):
         """Individual summary view page."""
+        # Select just the columns the page shows, so there are no ORM
+        # instances to build or detach
         with db.get_session() as session:
             video = (
-                session.query(Video)
+                session.query(
+                    Video.title,
+                    Video.url,
+                    Video.published_at,
+                    YouTubeChannel.channel_name,
+                    Summary.id.isnot(None).label("has_summary"),
+                    Summary.summary_text,
+                    Summary.key_points,
+                    Summary.model_used,
+                    Summary.created_at.label("summary_created_at"),
+                )
                 .join(Video.youtube_channel)
                 .join(YouTubeChannel.users)
+                .outerjoin(Video.summary)
                 .filter(User.id == current_user.id)
-                .options(joinedload(Video.youtube_channel), joinedload(Video.summary))
                 .filter(Video.id == video_id)
                 .first()
             )
 
-            if not video:
-                flash("Video not found", "danger")
-                return redirect(url_for("videos"))
-
-            # Extract data before expunging
-            video_data = {
-                "id": video.id,
-                "title": video.title,
-                "url": video.url,
-                "published_at": video.published_at,
-                "channel_name": video.youtube_channel.channel_name,
-                "has_summary": video.summary is not None,
-            }
-
-            if video.summary:
-                video_data["summary_text"] = video.summary.summary_text
-                video_data["key_points"] = video.summary.get_key_points()
-                video_data["model_used"] = video.summary.model_used
-                video_data["created_at"] = video.summary.created_at
+        if not video:
+            flash("Video not found", "danger")
+            return redirect(url_for("videos"))
 
-            session.expunge_all()
-
-        return render_template("summary.html", video=video_data)
+        return render_template("summary.html", video=video)
 
     @app.route("/key-points-by-creator")
     @login_required
     def key_points_by_creator():
         """View all key points grouped by creator/channel."""
-        # Get filter parameter
-        channel_filter = request.args.get("channel", "all")
+        # Get filter parameter; anything but a channel ID means all channels
+        channel_id = request.args.get("channel", type=int)
+        channel_filter = str(channel_id) if channel_id is not None else "all"
 
         # Get all channels for the dropdown
-        all_channels = db.get_all_channels(user_id=current_user.id)
-
-        # Get all summaries with channels
-        results = db.get_all_summaries_with_channels(user_id=current_user.id)
-
-        # Group results by channel
-        grouped_data = {}
-        for video, summary in results:
-            if summary is None:
-                continue
-
-            channel_name = video.youtube_channel.channel_name
-            if channel_name not in grouped_data:
-                grouped_data[channel_name] = {
-                    "channel_id": video.youtube_channel.id,
-                    "videos": [],
-                }
-
-            grouped_data[channel_name]["videos"].append({
-                "title": video.title,
-                "url": video.url,
-                "published_at": video.published_at,
-                "key_points": summary.get_key_points(),
-                "summary_id": summary.id,
-            })
-
-        # Filter by channel if specified
-        if channel_filter != "all":
-            filtered_data = {}
-            for channel_name, data in grouped_data.items():
-                if str(data["channel_id"]) == channel_filter:
-                    filtered_data[channel_name] = data
-            grouped_data = filtered_data
-
-        # Sort channels by name
-        sorted_channels = sorted(grouped_data.items())
+        all_channels = db.get_channel_choices(current_user.id)
 
-        return render_template(
+        video_counts = db.get_summary_counts_by_channel(
+            user_id=current_user.id, channel_id=channel_id
+        )
+
+        # Render while the key points are read, rather than building the
+        # whole page in memory first
+        return stream_template(
             "key_points.html",
-            grouped_data=sorted_channels,
+            grouped_data=db.iter_key_points_by_channel(
+                user_id=current_user.id, channel_id=channel_id
+            ),
+            video_counts=video_counts,
             channels=all_channels,
             channel_filter=channel_filter,
         )
@@ -346,30 +509,44 @@ def create_app(db_path=None):
     @login_required
     @admin_required
     def run_check():
-        """Trigger a manual run."""
+        """Trigger a manual run in the background."""
         try:
-            from .scheduler import check_and_process
+            job_id = uuid.uuid4().hex
+            if not db.start_run_job(job_id):
+                flash("A check is already running.", "warning")
+                return redirect(url_for("index"))
 
-            flash("Starting check and process... This may take a few minutes.", "info")
-
-            # Run in background (simple approach - could be improved with Celery)
-            result = check_and_process(db, config)
+            run_executor.submit(run_job, job_id)
 
             flash(
-                f"Processing complete! Found: {result['videos_found']}, "
-                f"Processed: {result['videos_processed']}",
-                "success",
+                f"Check started in the background (job {job_id}). "
+                "Results will appear in the run history.",
+                "info",
             )
 
-            if result["errors"]:
-                flash(f"Encountered {len(result['errors'])} errors", "warning")
-
         except Exception as e:
             logger.error(f"Error running check: {e}")
             flash(f"Error running check: {str(e)}", "danger")
 
         return redirect(url_for("index"))
 
+    @app.route("/api/job/<job_id>")
+    @login_required
+    @admin_required
+    def api_job(job_id):
+        """API endpoint for the status of a manual run."""
+        job = db.get_run_job(job_id)
+        if job is None:
+            abort(404)
+
+        if job["status"] == "running":
+            return jsonify({"job_id": job_id, "done": False})
+
+        if job["status"] == "failed":
+            return jsonify({"job_id": job_id, "done": True, "error": job["error"]})
+
+        return jsonify({"job_id": job_id, "done": True, "result": job["result"]})
+
     @app.route("/api/stats")
     @login_required
     def api_stats():
@@ -385,8 +562,14 @@ def create_app(db_path=None):
         
         if current_user.is_admin:
             response_data["total_runs"] = stats["total_runs"]
-            
-        return jsonify(response_data)
+
+        # Polling clients reuse the response for a few seconds, then
+        # revalidate with If-None-Match and get a 304 while nothing changed
+        response = jsonify(response_data)
+        response.cache_control.private = True
+        response.cache_control.max_age = 5
+        response.add_etag()
+        return response.make_conditional(request)
 
     @app.route("/settings")
     @login_required
@@ -446,6 +629,7 @@ def create_app(db_path=None):
         return redirect(url_for("settings"))
 
     @app.route("/telegram/webhook", methods=["POST"])
+    @csrf.exempt
     def telegram_webhook():
         """Handle Telegram webhook updates."""
         # Telegram bot runs in separate container - webhook processed there
@@ -458,6 +642,11 @@ def create_app(db_path=None):
     def not_found(e):
         return render_template("404.html"), 404
 
+    @app.errorhandler(CSRFError)
+    def csrf_error(e):
+        flash("Your session expired. Please try again.", "warning")
+        return redirect(request.referrer or url_for("index"))
+
     @app.errorhandler(500)
     def server_error(e):
         logger.error(f"Server error: {e}")
@@ -466,13 +655,55 @@ def create_app(db_path=None):
     return app
 
 
-def run_web_server(host="0.0.0.0", port=5000, debug=False):
-    """Run the Flask web server.
+class WebServer(BaseApplication):
+    """Gunicorn server running the ytsum web app."""
+
+    def __init__(self, options: dict):
+        """Initialize the server.
+
+        Args:
+            options: Gunicorn settings (bind, workers, threads, ...).
+        """
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return create_app()
+
+
+def run_web_server(host="0.0.0.0", port=5000, debug=False, threads=8, workers=1):
+    """Run the web server.
+
+    Debug mode uses Flask's development server with the reloader; otherwise
+    the app is served by Gunicorn with a pool of threads, so requests waiting
+    on YouTube or the database don't hold up other users.
 
     Args:
         host: Host to bind to (0.0.0.0 for all interfaces).
         port: Port to listen on.
         debug: Enable debug mode.
+        threads: Number of requests handled concurrently by each worker.
+        workers: Number of worker processes. Keep this at 1: the stats cache
+            and login rate limits are kept in each process's memory, so
+            extra workers see stale counts and multiply the limits.
     """
-    app = create_app()
-    app.run(host=host, port=port, debug=debug)
+    if debug:
+        app = create_app()
+        app.run(host=host, port=port, debug=debug)
+        return
+
+    # The app (and its database engine) is created in each worker after the
+    # fork, so connection pools are never shared between processes
+    options = {
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        "worker_class": "gthread",
+        "threads": threads,
+        "preload_app": False,
+        "accesslog": "-",
+    }
+    WebServer(options).run()
@@ -2,6 +2,7 @@
 
 import logging
 import re
+import threading
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
 
@@ -16,6 +17,46 @@ from youtube_transcript_api._errors import (
 
 logger = logging.getLogger(__name__)
 
+# URL shapes accepted for channels and videos, fused into one pattern each.
+# Every channel URL shape captures its identifier in a separate group.
+_CHANNEL_URL_RE = re.compile(
+    r"youtube\.com/(?:channel/(UC[\w-]+)|c/([\w-]+)|(@[\w-]+)|user/([\w-]+))"
+)
+_VIDEO_URL_RE = re.compile(
+    r"(?:youtube\.com/(?:watch\?v=|embed/)|youtu\.be/)([\w-]+)"
+)
+_VIDEO_ID_RE = re.compile(r"[\w-]{11}")
+_CHANNEL_ID_RE = re.compile(r"UC[\w-]{22}")
+
+# Most items the Data API returns per list call (and IDs it accepts per call)
+API_PAGE_SIZE = 50
+VIDEO_URL = "https://www.youtube.com/watch?v={}"
+
+# Built API resources, per thread and per API key. httplib2 connections
+# aren't thread-safe, so resources can't be shared between threads, but
+# every client in a thread reuses the same one.
+_services = threading.local()
+
+
+def _get_service(api_key: str):
+    """Get the calling thread's YouTube API resource for an API key.
+
+    Args:
+        api_key: YouTube Data API v3 key.
+
+    Returns:
+        googleapiclient resource, built on first use in this thread.
+    """
+    by_key = getattr(_services, "by_key", None)
+    if by_key is None:
+        by_key = _services.by_key = {}
+
+    service = by_key.get(api_key)
+    if service is None:
+        service = build("youtube", "v3", developerKey=api_key, cache_discovery=False)
+        by_key[api_key] = service
+    return service
+
 
 class YouTubeClient:
     """Client for interacting with YouTube."""
@@ -27,7 +68,15 @@ class YouTubeClient:
             api_key: YouTube Data API v3 key.
         """
         self.api_key = api_key
-        self.youtube = build("youtube", "v3", developerKey=api_key)
+
+    @property
+    def youtube(self):
+        """YouTube API resource for the calling thread.
+
+        Shared with other clients using the same key in this thread, so
+        creating a client is cheap and the kept-alive connection is reused.
+        """
+        return _get_service(self.api_key)
 
     @staticmethod
     def extract_channel_id(url_or_id: str) -> Optional[str]:
@@ -42,30 +91,28 @@ class YouTubeClient:
             url_or_id: YouTube channel URL or ID.
 
         Returns:
-            Channel ID or None if not found.
+            Channel ID (or the name from a custom URL, with handles kept as
+            "@name") or None if not found.
         """
         # If it looks like a channel ID already (starts with UC)
-        if url_or_id.startswith("UC") and len(url_or_id) == 24:
+        if _CHANNEL_ID_RE.fullmatch(url_or_id):
             return url_or_id
 
         # Extract from URL patterns
-        patterns = [
-            r"youtube\.com/channel/(UC[\w-]+)",
-            r"youtube\.com/c/([\w-]+)",
-            r"youtube\.com/@([\w-]+)",
-            r"youtube\.com/user/([\w-]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url_or_id)
-            if match:
-                return match.group(1)
+        match = _CHANNEL_URL_RE.search(url_or_id)
+        if match:
+            return next(group for group in match.groups() if group)
 
         return None
 
     def get_channel_info(self, channel_identifier: str) -> Optional[dict]:
         """Get channel information by ID, username, or custom URL.
 
+        Only the lookups that can match the identifier's form are made:
+        a channel ID is looked up by ID alone, a handle (@name) by handle,
+        and anything else by username. Search, which costs 100 quota
+        units instead of 1, is the last resort for handles and names.
+
         Args:
             channel_identifier: Channel ID, username, or handle.
 
@@ -73,38 +120,30 @@ class YouTubeClient:
             Dictionary with channel info (id, name, url) or None if not found.
         """
         try:
-            # First, try as channel ID
-            if channel_identifier.startswith("UC"):
+            if _CHANNEL_ID_RE.fullmatch(channel_identifier):
                 request = self.youtube.channels().list(
                     part="snippet", id=channel_identifier
                 )
-                response = request.execute()
+                return self._first_channel(request.execute())
 
-                if response.get("items"):
-                    item = response["items"][0]
-                    return {
-                        "id": item["id"],
-                        "name": item["snippet"]["title"],
-                        "url": f"https://www.youtube.com/channel/{item['id']}",
-                    }
-
-            # Try as username
-            request = self.youtube.channels().list(
-                part="snippet", forUsername=channel_identifier
-            )
-            response = request.execute()
-
-            if response.get("items"):
-                item = response["items"][0]
-                return {
-                    "id": item["id"],
-                    "name": item["snippet"]["title"],
-                    "url": f"https://www.youtube.com/channel/{item['id']}",
-                }
+            if channel_identifier.startswith("@"):
+                request = self.youtube.channels().list(
+                    part="snippet", forHandle=channel_identifier
+                )
+            else:
+                request = self.youtube.channels().list(
+                    part="snippet", forUsername=channel_identifier
+                )
+            channel = self._first_channel(request.execute())
+            if channel:
+                return channel
 
-            # Try as handle (custom URL)
+            # Fall back to searching for the name
             request = self.youtube.search().list(
-                part="snippet", q=channel_identifier, type="channel", maxResults=1
+                part="snippet",
+                q=channel_identifier.lstrip("@"),
+                type="channel",
+                maxResults=1,
             )
             response = request.execute()
 
@@ -122,6 +161,19 @@ class YouTubeClient:
 
         return None
 
+    @staticmethod
+    def _first_channel(response: dict) -> Optional[dict]:
+        """Build channel info from the first item of a channels.list response."""
+        if not response.get("items"):
+            return None
+
+        item = response["items"][0]
+        return {
+            "id": item["id"],
+            "name": item["snippet"]["title"],
+            "url": f"https://www.youtube.com/channel/{item['id']}",
+        }
+
     def get_recent_videos(
         self, channel_id: str, days_back: int = 7, max_results: int = 50
     ) -> List[dict]:
@@ -138,44 +190,48 @@ class YouTubeClient:
         try:
             published_after = (datetime.utcnow() - timedelta(days=days_back)).isoformat() + "Z"
 
-            # Search for videos
-            request = self.youtube.search().list(
-                part="snippet",
-                channelId=channel_id,
-                type="video",
-                order="date",
-                publishedAfter=published_after,
-                maxResults=max_results,
-            )
-            response = request.execute()
-
-            if not response.get("items"):
-                return []
-
-            # Get video IDs
-            video_ids = [item["id"]["videoId"] for item in response["items"]]
-
-            # Get video details (including duration)
-            videos_request = self.youtube.videos().list(
-                part="snippet,contentDetails", id=",".join(video_ids)
-            )
-            videos_response = videos_request.execute()
-
-            videos = []
-            for item in videos_response.get("items", []):
-                videos.append(
-                    {
-                        "id": item["id"],
-                        "title": item["snippet"]["title"],
-                        "published_at": datetime.fromisoformat(
-                            item["snippet"]["publishedAt"].replace("Z", "+00:00")
-                        ),
-                        "url": f"https://www.youtube.com/watch?v={item['id']}",
-                        "duration": item["contentDetails"]["duration"],
-                    }
+            # Search for videos, a page (at most 50) at a time
+            video_ids = []
+            page_token = None
+            while len(video_ids) < max_results:
+                request = self.youtube.search().list(
+                    part="snippet",
+                    channelId=channel_id,
+                    type="video",
+                    order="date",
+                    publishedAfter=published_after,
+                    maxResults=min(max_results - len(video_ids), API_PAGE_SIZE),
+                    pageToken=page_token,
                 )
+                response = request.execute()
+                video_ids.extend(item["id"]["videoId"] for item in response.get("items", []))
+
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    break
+
+            # Get video details (including duration), up to 50 IDs per call
+            items = []
+            for start in range(0, len(video_ids), API_PAGE_SIZE):
+                videos_request = self.youtube.videos().list(
+                    part="snippet,contentDetails",
+                    id=",".join(video_ids[start : start + API_PAGE_SIZE]),
+                )
+                items.extend(videos_request.execute().get("items", []))
 
-            return videos
+            # publishedAt is always UTC ("...Z"), which fromisoformat only
+            # accepts from Python 3.11, so swap the suffix for an offset
+            fromiso = datetime.fromisoformat
+            return [
+                {
+                    "id": item["id"],
+                    "title": item["snippet"]["title"],
+                    "published_at": fromiso(item["snippet"]["publishedAt"][:-1] + "+00:00"),
+                    "url": VIDEO_URL.format(item["id"]),
+                    "duration": item["contentDetails"]["duration"],
+                }
+                for item in items
+            ]
 
         except HttpError as e:
             logger.error(f"Error fetching recent videos for channel {channel_id}: {e}")
@@ -192,29 +248,23 @@ class YouTubeClient:
             Tuple of (transcript_text, language_code) or None if unavailable.
         """
         try:
-            # Create API instance
-            api = YouTubeTranscriptApi()
-
-            # Try to get English transcript first
-            try:
-                transcript_result = api.fetch(video_id, languages=['en'])
-            except:
-                # Fall back to any available transcript
-                try:
-                    transcript_result = api.fetch(video_id)
-                except:
-                    # No transcript available
-                    logger.warning(f"No transcript found for video {video_id}")
-                    return None
-
-            # Extract language code
-            language = transcript_result.language_code if hasattr(transcript_result, 'language_code') else 'unknown'
+            # List what's available once, then pick English if there is one
+            # (manually created before auto-generated), else the first listed
+            transcripts = list(YouTubeTranscriptApi().list(video_id))
+            transcript = next(
+                (t for t in transcripts if t.language_code == "en"),
+                transcripts[0] if transcripts else None,
+            )
+            if transcript is None:
+                logger.warning(f"No transcript found for video {video_id}")
+                return None
+
+            transcript_result = transcript.fetch()
 
             # Combine all text segments from the transcript snippets
-            # The result is iterable and contains FetchedTranscriptSnippet objects
-            full_text = " ".join([snippet.text for snippet in transcript_result])
+            full_text = " ".join(snippet.text for snippet in transcript_result)
 
-            return (full_text, language)
+            return (full_text, transcript_result.language_code)
 
         except TranscriptsDisabled:
             logger.warning(f"Transcripts are disabled for video {video_id}")
@@ -239,19 +289,12 @@ class YouTubeClient:
         Returns:
             Video ID or None if not found.
         """
-        patterns = [
-            r"youtube\.com/watch\?v=([\w-]+)",
-            r"youtu\.be/([\w-]+)",
-            r"youtube\.com/embed/([\w-]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        match = _VIDEO_URL_RE.search(url)
+        if match:
+            return match.group(1)
 
         # If it looks like a video ID already (11 characters)
-        if len(url) == 11 and re.match(r"^[\w-]+$", url):
+        if _VIDEO_ID_RE.fullmatch(url):
             return url
 
         return None
@@ -0,0 +1,62 @@
+"""Shared fixtures for the ytsum test suite."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from ytsum.config import Config, set_config
+from ytsum.database import Database
+from ytsum.web import create_app
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Point the configuration at a fresh database under tmp_path."""
+    path = tmp_path / "ytsum.db"
+    monkeypatch.setenv("DATABASE_PATH", str(path))
+    monkeypatch.setenv("LOG_PATH", str(tmp_path / "logs"))
+    monkeypatch.setenv("FLASK_SECRET_KEY", "test-secret-key")
+    set_config(Config(env_file=tmp_path / ".env"))
+    yield path
+    set_config(None)
+
+
+@pytest.fixture
+def app(db_path):
+    """Web app for tests, with CSRF checks off so forms can be posted."""
+    app = create_app(db_path)
+    app.config["TESTING"] = True
+    app.config["WTF_CSRF_ENABLED"] = False
+    return app
+
+
+@pytest.fixture
+def db(app, db_path):
+    """Database shared with the app."""
+    return Database(db_path)
+
+
+@pytest.fixture
+def user(db):
+    """A user following one channel with a few videos."""
+    user = db.add_user("alice", "password")
+    channel = db.add_channel("UCabc", "Channel A", "https://youtube.com/channel/UCabc", user_id=user.id)
+    for i in range(3):
+        db.add_video(
+            f"video{i}",
+            channel.id,
+            f"Video {i}",
+            datetime(2024, 1, 1) + timedelta(days=i),
+            f"https://youtube.com/watch?v=video{i}",
+            "PT1M",
+        )
+    return user
+
+
+@pytest.fixture
+def client(app, user):
+    """Test client logged in as the fixture user."""
+    client = app.test_client()
+    response = client.post("/login", data={"username": "alice", "password": "password"})
+    assert response.status_code == 302
+    return client
@@ -0,0 +1,81 @@
+"""Tests for the web interface."""
+
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from ytsum import scheduler
+from ytsum.database import Database, RunJob
+from ytsum.web import encode_page_cursor
+
+
+def make_cursor(published_at, video_id):
+    """Build a page cursor for a (published_at, id) that needn't exist."""
+    return encode_page_cursor(SimpleNamespace(published_at=published_at, id=video_id))
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll until condition() is true, for work done in the run thread."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_videos_first_page(client):
+    response = client.get("/videos")
+    assert response.status_code == 200
+    assert b"Video 2" in response.data
+
+
+def test_videos_empty_cursor_page_redirects_to_first_page(client):
+    cursor = make_cursor(datetime(2000, 1, 1), 1)
+    response = client.get(f"/videos?after={cursor}&has_summary=no")
+    assert response.status_code == 302
+    assert response.headers["Location"] == "/videos?has_summary=no"
+
+
+def test_videos_stale_cursors_redirect_to_first_page(client):
+    older = make_cursor(datetime(2000, 1, 1), 1)
+    newer = make_cursor(datetime(2100, 1, 1), 1)
+    for query in (f"after={older}", f"before={newer}"):
+        response = client.get(f"/videos?{query}")
+        assert response.status_code == 302
+        assert response.headers["Location"] == "/videos"
+
+
+def test_videos_malformed_cursor_is_rejected(client):
+    for token in ("not-a-cursor!", "bm90LWEtY3Vyc29y", make_cursor(datetime(2024, 1, 1), 1)[:-4]):
+        assert client.get(f"/videos?after={token}").status_code == 400
+        assert client.get(f"/videos?before={token}").status_code == 400
+
+
+def test_key_points_by_creator_ignores_bad_channel_filter(client):
+    response = client.get("/key-points-by-creator?channel=abc")
+    assert response.status_code == 200
+    assert b'value="all" selected' in response.data
+
+
+def test_run_records_result(client, db, monkeypatch):
+    monkeypatch.setattr(scheduler, "check_and_process", lambda db, config: {"videos_processed": 1})
+    assert client.post("/run").status_code == 302
+
+    def finished_job():
+        with db.get_session() as session:
+            return session.query(RunJob).filter(RunJob.status != "running").first()
+
+    wait_for(finished_job)
+    job = db.get_run_job(finished_job().id)
+    assert job["status"] == "done"
+    assert job["result"] == {"videos_processed": 1}
+
+
+def test_run_logs_when_outcome_cannot_be_recorded(client, monkeypatch, caplog):
+    def fail(*args, **kwargs):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(scheduler, "check_and_process", lambda db, config: {})
+    monkeypatch.setattr(Database, "finish_run_job", fail)
+    assert client.post("/run").status_code == 302
+
+    wait_for(lambda: "Could not record the outcome of run" in caplog.text)